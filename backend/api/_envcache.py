@@ -0,0 +1,61 @@
+import os
+from pathlib import Path
+from typing import Dict, Tuple
+
+ENV_FILE = ".env"
+
+# In-process cache of parsed .env contents, keyed by file mtime.
+_cache: Dict[str, str] = {}
+_mtime: int = -1
+
+
+def load() -> Tuple[Dict[str, str], int]:
+    """Load .env as a dict, re-parsing only when the file changed on disk."""
+    global _cache, _mtime
+
+    try:
+        mtime = os.stat(ENV_FILE).st_mtime_ns
+    except FileNotFoundError:
+        _cache = {}
+        _mtime = -1
+        return _cache, _mtime
+
+    if mtime != _mtime:
+        parsed = {}
+        for line in Path(ENV_FILE).read_text().splitlines():
+            if '=' in line and not line.lstrip().startswith('#'):
+                key, _, value = line.partition('=')
+                parsed[key.strip()] = value.strip()
+        _cache = parsed
+        _mtime = mtime
+
+    return _cache, _mtime
+
+
+def save(env: Dict[str, str]):
+    """Atomically write the full env dict back to .env and refresh the cache."""
+    global _cache, _mtime
+
+    serialized = "".join(f"{key}={value}\n" for key, value in env.items())
+
+    # Write to a temp file and os.replace so readers never see a partial .env
+    tmp_file = ENV_FILE + ".tmp"
+    with open(tmp_file, 'w') as f:
+        f.write(serialized)
+
+    # Keep file permissions restrictive since this holds API keys
+    try:
+        os.chmod(tmp_file, 0o600)
+    except OSError:
+        pass
+
+    os.replace(tmp_file, ENV_FILE)
+
+    _cache = dict(env)
+    _mtime = os.stat(ENV_FILE).st_mtime_ns
+
+
+def invalidate():
+    """Force a re-parse on the next load()."""
+    global _mtime
+    _mtime = -1
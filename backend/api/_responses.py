@@ -0,0 +1,16 @@
+from fastapi.responses import ORJSONResponse
+
+
+def ok(data=None, message: str = "") -> ORJSONResponse:
+    """Success response encoded directly with orjson.
+
+    Skips APIResponse model construction and FastAPI's second validation
+    pass on hot read paths; the APIResponse schema is still advertised via
+    response_model on the route.
+    """
+    return ORJSONResponse({"success": True, "message": message, "data": data, "error": None})
+
+
+def err(error: str, message: str = "") -> ORJSONResponse:
+    """Error response encoded directly with orjson."""
+    return ORJSONResponse({"success": False, "message": message, "data": None, "error": error})
@@ -1,8 +1,11 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
 from sqlalchemy.orm import Session
-import json
+import asyncio
+import orjson
 import os
-from ..core.config_models import GridConfig, APIResponse
+from functools import lru_cache
+from . import _envcache
+from ..core.config_models import GridConfig, APIResponse, CONFIG_ADAPTER
 from ..core.db import get_db, save_config_history
 from ..engine.services import bot_service
 from ..engine.exchange_validator import ExchangeValidator
@@ -11,6 +14,17 @@ router = APIRouter(prefix="/api", tags=["config"])
 
 CONFIG_FILE = "config.json"
 
+# Serializes concurrent PUT /api/config writes
+_config_write_lock = asyncio.Lock()
+
+
+def _write_config_file(config_dict: dict):
+    """Atomically write config.json in one buffered encode + os.replace."""
+    tmp_file = CONFIG_FILE + ".tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(orjson.dumps(config_dict, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_file, CONFIG_FILE)
+
 
 @router.get("/config")
 async def get_config():
@@ -19,11 +33,10 @@ async def get_config():
         config = bot_service.config
         if not config:
             # Load from file if not in memory
-            if os.path.exists(CONFIG_FILE):
-                with open(CONFIG_FILE, 'r') as f:
-                    config_data = json.load(f)
-                    config = GridConfig(**config_data)
-            else:
+            try:
+                with open(CONFIG_FILE, 'rb') as f:
+                    config = CONFIG_ADAPTER.validate_json(f.read())
+            except FileNotFoundError:
                 # Return default config
                 config = GridConfig(
                     upper_bound=65000,
@@ -92,41 +105,20 @@ async def update_config(config: GridConfig, db: Session = Depends(get_db)):
         # Validate config
         config_dict = config.model_dump()
 
-        # Save to file
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config_dict, f, indent=2)
-
-        # Save to .env (some settings)
-        env_file = ".env"
-        env_lines = []
-
-        if os.path.exists(env_file):
-            with open(env_file, 'r') as f:
-                env_lines = f.readlines()
-
-        # Update relevant .env values
-        env_updates = {
-            'MODE': config.mode,
-            'EXCHANGE': config.exchange,
-            'NETWORK': config.network or 'live',
-            'SYMBOL': config.symbol
-        }
-
-        updated_lines = []
-        for line in env_lines:
-            key = line.split('=')[0].strip() if '=' in line else ''
-            if key in env_updates:
-                updated_lines.append(f"{key}={env_updates[key]}\n")
-                del env_updates[key]
-            else:
-                updated_lines.append(line)
-
-        # Add any missing keys
-        for key, value in env_updates.items():
-            updated_lines.append(f"{key}={value}\n")
-
-        with open(env_file, 'w') as f:
-            f.writelines(updated_lines)
+        async with _config_write_lock:
+            # Save to file
+            _write_config_file(config_dict)
+
+            # Save to .env (some settings)
+            env, _ = _envcache.load()
+            env = dict(env)
+            env.update({
+                'MODE': config.mode,
+                'EXCHANGE': config.exchange,
+                'NETWORK': config.network or 'live',
+                'SYMBOL': config.symbol
+            })
+            _envcache.save(env)
 
         # Save to history
         save_config_history(db, config_dict)
@@ -144,26 +136,43 @@ async def update_config(config: GridConfig, db: Session = Depends(get_db)):
 
 
 @router.get("/levels")
-async def get_levels():
-    """Get calculated grid levels."""
+async def get_levels(request: Request, response: Response):
+    """Get calculated grid levels.
+
+    The ETag is the engine's grid_version, so polling clients get a 304
+    without a body while the grid is unchanged.
+    """
     try:
+        etag = f'W/"{bot_service.engine.grid_version}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304)
         levels = await bot_service.get_grid_levels()
+        response.headers["ETag"] = etag
         return APIResponse(success=True, data={"levels": levels})
     except Exception as e:
         return APIResponse(success=False, error=str(e))
 
 
+@lru_cache(maxsize=128)
+def _normalize_symbol(exchange: str, symbol: str) -> str:
+    """Convert UI symbol format to the exchange's, e.g. BTC/THB -> THB_BTC."""
+    if exchange == "bitkub" and "/" in symbol:
+        parts = symbol.split("/")
+        return f"{parts[1]}_{parts[0]}"
+    return symbol
+
+
+@lru_cache(maxsize=256)
+def _min_req(exchange: str, symbol: str) -> dict:
+    """Memoized minimum order info lookup; requirements change rarely."""
+    return ExchangeValidator.get_minimum_order_info(exchange, symbol)
+
+
 @router.get("/minimum-requirements/{exchange}/{symbol}")
 async def get_minimum_requirements(exchange: str, symbol: str):
     """Get minimum order requirements for a symbol."""
     try:
-        # Convert symbol format if needed
-        if exchange == "bitkub" and "/" in symbol:
-            # Convert BTC/THB to THB_BTC
-            parts = symbol.split("/")
-            symbol = f"{parts[1]}_{parts[0]}"
-
-        requirements = ExchangeValidator.get_minimum_order_info(exchange, symbol)
+        requirements = _min_req(exchange, _normalize_symbol(exchange, symbol))
 
         if not requirements:
             return APIResponse(
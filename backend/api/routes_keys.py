@@ -1,9 +1,14 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Optional
+import asyncio
 import os
+import time
+from functools import lru_cache
+from . import _envcache
 from ..core.config_models import APIResponse
 from ..core.logging import logger
+from ..engine.exchange_registry import get_exchange_client, close_all_clients
 
 router = APIRouter(prefix="/api", tags=["keys"])
 
@@ -21,24 +26,41 @@ class KeysRequest(BaseModel):
     network: Optional[str] = "live"
 
 
+# Credential-related keys removed by DELETE /api/keys
+_REMOVE_KEYS = frozenset({
+    'EXCHANGE',
+    'OKX_API_KEY', 'OKX_API_SECRET', 'OKX_PASSPHRASE',
+    'BITKUB_API_KEY', 'BITKUB_API_SECRET',
+    'NETWORK'
+})
+
+# Short-TTL ticker cache for balance valuation; FX rates are stable for seconds
+_ticker_cache = {}
+_TICKER_TTL = 5.0
+
+
+async def _cached_ticker(client, symbol: str, ttl: float = _TICKER_TTL) -> dict:
+    """Fetch a ticker through a short TTL cache to absorb repeated tests."""
+    now = time.monotonic()
+    cached = _ticker_cache.get(symbol)
+    if cached and now - cached[0] < ttl:
+        return cached[1]
+    ticker = await client.fetch_ticker(symbol)
+    _ticker_cache[symbol] = (now, ticker)
+    return ticker
+
+
+@lru_cache(maxsize=64)
 def mask_key(key: str) -> str:
-    """Mask API key for display."""
-    if not key or len(key) < 8:
-        return "****"
-    return key[:4] + "****" + key[-4:]
+    """Mask API key for display; cached since keys are stable across polls."""
+    return f"{key[:4]}****{key[-4:]}" if key and len(key) >= 8 else "****"
 
 
 @router.post("/keys")
 async def save_keys(request: KeysRequest):
     """Save API keys to .env file."""
     try:
-        env_file = ".env"
-        env_lines = []
-
-        # Read existing .env
-        if os.path.exists(env_file):
-            with open(env_file, 'r') as f:
-                env_lines = f.readlines()
+        env, _ = _envcache.load()
 
         # Prepare updates
         updates = {}
@@ -59,35 +81,14 @@ async def save_keys(request: KeysRequest):
 
         updates['EXCHANGE'] = request.exchange
 
-        # Update env lines
-        updated_lines = []
-        updated_keys = set()
-
-        for line in env_lines:
-            if '=' in line:
-                key = line.split('=')[0].strip()
-                if key in updates:
-                    updated_lines.append(f"{key}={updates[key]}\n")
-                    updated_keys.add(key)
-                else:
-                    updated_lines.append(line)
-            else:
-                updated_lines.append(line)
-
-        # Add new keys
-        for key, value in updates.items():
-            if key not in updated_keys:
-                updated_lines.append(f"{key}={value}\n")
-
-        # Write back to .env
-        with open(env_file, 'w') as f:
-            f.writelines(updated_lines)
+        # Merge updates and write back to .env
+        env = dict(env)
+        env.update(updates)
+        _envcache.save(env)
 
-        # Set file permissions to 0600 if possible
-        try:
-            os.chmod(env_file, 0o600)
-        except:
-            pass
+        # Make new credentials visible to exchange clients created from env
+        os.environ.update(updates)
+        await close_all_clients()
 
         # Return masked keys
         response_data = {
@@ -118,25 +119,16 @@ async def save_keys(request: KeysRequest):
 async def get_keys_status():
     """Get API keys status (whether they exist)."""
     try:
-        from dotenv import load_dotenv
-        import importlib
-        import sys
+        env, _ = _envcache.load()
 
-        # Force reload environment variables
-        if 'os' in sys.modules:
-            importlib.reload(sys.modules['os'])
-
-        # Clear existing environment and reload
-        load_dotenv(override=True)
-
-        exchange = os.getenv("EXCHANGE", "okx")
-        network = os.getenv("NETWORK", "live")
+        exchange = env.get("EXCHANGE", "okx")
+        network = env.get("NETWORK", "live")
 
         has_keys = False
         if exchange == "okx":
-            has_keys = bool(os.getenv("OKX_API_KEY") and os.getenv("OKX_API_SECRET") and os.getenv("OKX_PASSPHRASE"))
+            has_keys = bool(env.get("OKX_API_KEY") and env.get("OKX_API_SECRET") and env.get("OKX_PASSPHRASE"))
         elif exchange == "bitkub":
-            has_keys = bool(os.getenv("BITKUB_API_KEY") and os.getenv("BITKUB_API_SECRET"))
+            has_keys = bool(env.get("BITKUB_API_KEY") and env.get("BITKUB_API_SECRET"))
 
         return APIResponse(
             success=True,
@@ -155,42 +147,21 @@ async def get_keys_status():
 async def delete_keys():
     """Delete API keys from .env file."""
     try:
-        env_file = ".env"
-
-        if not os.path.exists(env_file):
+        env, mtime = _envcache.load()
+        if mtime < 0:
             return APIResponse(success=False, message="No configuration file found")
 
-        # Read existing .env
-        with open(env_file, 'r') as f:
-            env_lines = f.readlines()
-
-        # Keys to remove
-        keys_to_remove = [
-            'EXCHANGE',
-            'OKX_API_KEY', 'OKX_API_SECRET', 'OKX_PASSPHRASE',
-            'BITKUB_API_KEY', 'BITKUB_API_SECRET',
-            'NETWORK'
-        ]
-
-        # Filter out the API key lines
-        updated_lines = []
-        for line in env_lines:
-            if '=' in line:
-                key = line.split('=')[0].strip()
-                if key not in keys_to_remove:
-                    updated_lines.append(line)
-            else:
-                updated_lines.append(line)
-
-        # Write back to .env
-        with open(env_file, 'w') as f:
-            f.writelines(updated_lines)
+        # Drop the API key entries and write back to .env
+        env = {key: value for key, value in env.items() if key not in _REMOVE_KEYS}
+        _envcache.save(env)
 
         # Clear from current process environment
-        for key in keys_to_remove:
+        for key in _REMOVE_KEYS:
             if key in os.environ:
                 del os.environ[key]
 
+        await close_all_clients()
+
         return APIResponse(
             success=True,
             message="API keys deleted successfully",
@@ -205,17 +176,13 @@ async def delete_keys():
 async def test_api_connection():
     """Test API connection with current credentials."""
     try:
-        from dotenv import load_dotenv
-        load_dotenv()
-
-        exchange = os.getenv("EXCHANGE", "okx")
+        env, _ = _envcache.load()
+        exchange = env.get("EXCHANGE", "okx")
 
         # Test based on exchange
         if exchange == "okx":
-            from ..engine.exchange_okx_ccxt import OKXExchange
-
             try:
-                exchange_client = OKXExchange()
+                exchange_client = get_exchange_client("okx")
                 # Try to fetch balance as connection test
                 balance = await exchange_client.fetch_balance()
 
@@ -232,30 +199,32 @@ async def test_api_connection():
                                 'used': balance['used'].get(currency, 0)
                             }
 
-                            # Calculate THB value for each currency (OKX uses USDT as base)
-                            if currency == 'USDT':
-                                # Convert USDT to THB (approximate rate: 1 USDT = ~36 THB)
-                                try:
-                                    ticker = await exchange_client.fetch_ticker('USDT/THB')
-                                    usdt_price = ticker['last']  # USDT price in THB
-                                    total_value_thb += amount * usdt_price
-                                except Exception:
-                                    # Fallback approximation if ticker fails
-                                    total_value_thb += amount * 36.0
-                            elif currency == 'BTC':
-                                try:
-                                    # Get BTC/USDT price and convert to THB
-                                    ticker_btc = await exchange_client.fetch_ticker('BTC/USDT')
-                                    btc_usdt_price = ticker_btc['last']
-                                    ticker_usdt = await exchange_client.fetch_ticker('USDT/THB')
-                                    usdt_thb_price = ticker_usdt['last']
-                                    btc_thb_price = btc_usdt_price * usdt_thb_price
-                                    total_value_thb += amount * btc_thb_price
-                                except Exception:
-                                    # Fallback approximation
-                                    total_value_thb += amount * 2500000.0  # Rough BTC/THB estimate
-
-                await exchange_client.close()
+                    # Fetch all conversion tickers in one concurrent batch (OKX uses USDT as base)
+                    needed = set()
+                    if 'USDT' in non_zero_balance:
+                        needed.add('USDT/THB')
+                    if 'BTC' in non_zero_balance:
+                        needed.update(('BTC/USDT', 'USDT/THB'))
+                    needed = sorted(needed)
+                    results = await asyncio.gather(
+                        *(_cached_ticker(exchange_client, s) for s in needed),
+                        return_exceptions=True
+                    )
+                    prices = {s: r['last'] for s, r in zip(needed, results)
+                              if not isinstance(r, Exception)}
+
+                    # Calculate THB value for each currency
+                    for currency, info in non_zero_balance.items():
+                        amount = info['total']
+                        if currency == 'USDT':
+                            # Fallback approximation if ticker fetch failed
+                            total_value_thb += amount * prices.get('USDT/THB', 36.0)
+                        elif currency == 'BTC':
+                            if 'BTC/USDT' in prices and 'USDT/THB' in prices:
+                                total_value_thb += amount * prices['BTC/USDT'] * prices['USDT/THB']
+                            else:
+                                # Rough BTC/THB estimate
+                                total_value_thb += amount * 2500000.0
 
                 return APIResponse(
                     success=True,
@@ -263,12 +232,13 @@ async def test_api_connection():
                     data={
                         "exchange": "okx",
                         "status": "connected",
-                        "network": os.getenv("NETWORK", "live"),
+                        "network": env.get("NETWORK", "live"),
                         "balance": non_zero_balance,
                         "total_value_thb": total_value_thb
                     }
                 )
             except Exception as e:
+                await close_all_clients()
                 error_msg = str(e)
                 if "apiKey" in error_msg or "API" in error_msg:
                     return APIResponse(
@@ -284,10 +254,8 @@ async def test_api_connection():
                     )
 
         elif exchange == "bitkub":
-            from ..engine.exchange_bitkub import BitkubExchange
-
             try:
-                exchange_client = BitkubExchange()
+                exchange_client = get_exchange_client("bitkub")
                 # Try to fetch balance as connection test
                 balance = await exchange_client.fetch_balance()
 
@@ -304,28 +272,25 @@ async def test_api_connection():
                                 'used': balance['used'].get(currency, 0)
                             }
 
-                            # Calculate THB value for each currency
-                            if currency == 'THB':
-                                total_value_thb += amount
-                            elif currency == 'BTC':
-                                try:
-                                    # Fetch BTC/THB price
-                                    ticker = await exchange_client.fetch_ticker('THB_BTC')
-                                    btc_price = ticker['last']  # Current BTC price in THB
-                                    total_value_thb += amount * btc_price
-                                except Exception as e:
-                                    logger.warning(f"Failed to get BTC price for portfolio calculation: {e}")
-                            elif currency == 'DOGE':
-                                try:
-                                    # Fetch DOGE/THB price
-                                    ticker = await exchange_client.fetch_ticker('THB_DOGE')
-                                    doge_price = ticker['last']  # Current DOGE price in THB
-                                    total_value_thb += amount * doge_price
-                                except Exception as e:
-                                    logger.warning(f"Failed to get DOGE price for portfolio calculation: {e}")
-                            # Add other currencies as needed
-
-                await exchange_client.close()
+                    # Fetch all conversion tickers in one concurrent batch
+                    # Add other currencies as needed
+                    needed = [f"THB_{c}" for c in non_zero_balance if c in ('BTC', 'DOGE')]
+                    results = await asyncio.gather(
+                        *(_cached_ticker(exchange_client, s) for s in needed),
+                        return_exceptions=True
+                    )
+                    prices = {s: r['last'] for s, r in zip(needed, results)
+                              if not isinstance(r, Exception)}
+
+                    # Calculate THB value for each currency
+                    for currency, info in non_zero_balance.items():
+                        amount = info['total']
+                        if currency == 'THB':
+                            total_value_thb += amount
+                        elif f"THB_{currency}" in prices:
+                            total_value_thb += amount * prices[f"THB_{currency}"]
+                        elif currency in ('BTC', 'DOGE'):
+                            logger.warning(f"Failed to get {currency} price for portfolio calculation")
 
                 return APIResponse(
                     success=True,
@@ -338,6 +303,7 @@ async def test_api_connection():
                     }
                 )
             except Exception as e:
+                await close_all_clients()
                 error_msg = str(e)
                 if "API" in error_msg or "Invalid" in error_msg:
                     return APIResponse(
@@ -1,16 +1,23 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, select
 from typing import Optional
 from datetime import datetime, timedelta
-import json
+from functools import lru_cache
 from ..core.config_models import APIResponse
+from ._responses import ok, err
 from ..core.db import get_db, ActionLogDB
 
 router = APIRouter(prefix="/api", tags=["logs"])
 
 
-@router.get("/logs")
+@lru_cache(maxsize=256)
+def _parse_since(s: str) -> datetime:
+    """Parse an ISO timestamp, memoized since pollers repeat the same value."""
+    return datetime.fromisoformat(s.replace('Z', '+00:00'))
+
+
+@router.get("/logs", response_model=APIResponse)
 async def get_logs(
     action: Optional[str] = Query(None, description="Filter by action type"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of logs"),
@@ -19,34 +26,35 @@ async def get_logs(
 ):
     """Get action logs."""
     try:
-        query = db.query(ActionLogDB)
+        # Select plain columns instead of hydrating ORM objects
+        stmt = select(
+            ActionLogDB.id, ActionLogDB.ts, ActionLogDB.user, ActionLogDB.action,
+            ActionLogDB.params, ActionLogDB.result, ActionLogDB.mode, ActionLogDB.exchange
+        )
 
         # Apply filters
         if action:
-            query = query.filter(ActionLogDB.action == action)
+            stmt = stmt.where(ActionLogDB.action == action)
 
         if since:
-            since_time = datetime.fromisoformat(since.replace('Z', '+00:00'))
-            query = query.filter(ActionLogDB.ts >= since_time)
+            stmt = stmt.where(ActionLogDB.ts >= _parse_since(since))
 
         # Order by timestamp descending and limit
-        logs = query.order_by(desc(ActionLogDB.ts)).limit(limit).all()
+        rows = db.execute(stmt.order_by(desc(ActionLogDB.ts)).limit(limit)).mappings().all()
 
         # Format logs for response
-        log_data = []
-        for log in logs:
-            log_data.append({
-                "id": log.id,
-                "timestamp": log.ts.isoformat() if log.ts else "",
-                "user": log.user,
-                "action": log.action,
-                "params": json.loads(log.params) if log.params else {},
-                "result": log.result,
-                "mode": log.mode,
-                "exchange": log.exchange
-            })
-
-        return APIResponse(success=True, data={"logs": log_data})
+        log_data = [{
+            "id": row["id"],
+            "timestamp": row["ts"].isoformat() if row["ts"] else "",
+            "user": row["user"],
+            "action": row["action"],
+            "params": row["params"] or {},
+            "result": row["result"],
+            "mode": row["mode"],
+            "exchange": row["exchange"]
+        } for row in rows]
+
+        return ok({"logs": log_data})
 
     except Exception as e:
-        return APIResponse(success=False, error=str(e))
\ No newline at end of file
+        return err(str(e))
\ No newline at end of file
@@ -1,53 +1,46 @@
-from fastapi import APIRouter
+import heapq
+from collections import Counter
+from fastapi import APIRouter, Query
+from operator import itemgetter
+from typing import Optional
 from ..core.config_models import APIResponse
+from ._responses import ok, err
 from ..engine.services import bot_service
 from ..core.logging import logger
 
 router = APIRouter(prefix="/api", tags=["orders"])
 
 
-@router.get("/orders/active")
-async def get_active_orders():
+@router.get("/orders/active", response_model=APIResponse)
+async def get_active_orders(
+    limit: Optional[int] = Query(None, ge=1, description="Return only the top N orders by price")
+):
     """Get all active orders with their details."""
     try:
         engine = bot_service.engine
 
         if not engine or not engine.active_orders:
-            return APIResponse(success=True, data={"orders": [], "count": 0})
-
-        # Get all active orders
-        orders = []
-        for order_id, order_info in engine.active_orders.items():
-            if order_info['status'] == 'open':
-                # Get the level price
-                level_price = engine.levels[order_info['level_index']] if order_info['level_index'] < len(engine.levels) else order_info['price']
-
-                orders.append({
-                    'id': order_id,
-                    'level_index': order_info['level_index'],
-                    'price': order_info['price'],
-                    'side': order_info['side'],
-                    'amount': order_info['size'],
-                    'zone_id': order_info.get('zone_id', 0),
-                    'status': order_info['status']
-                })
-
-        # Sort by price
-        orders.sort(key=lambda x: x['price'], reverse=True)
-
-        return APIResponse(
-            success=True,
-            data={
-                "orders": orders,
-                "count": len(orders),
-                "buy_count": len([o for o in orders if o['side'] == 'buy']),
-                "sell_count": len([o for o in orders if o['side'] == 'sell'])
-            }
-        )
+            return ok({"orders": [], "count": 0})
+
+        # Read from the engine's immutable snapshot, sorted by price
+        open_orders = [o for o in engine.orders_snapshot if o['status'] == 'open']
+        if limit is not None and limit < len(open_orders):
+            # Top-K selection is O(n log k) vs O(n log n) for a full sort
+            orders = heapq.nlargest(limit, open_orders, key=itemgetter('price'))
+        else:
+            orders = sorted(open_orders, key=itemgetter('price'), reverse=True)
+        sides = Counter(o['side'] for o in orders)
+
+        return ok({
+            "orders": orders,
+            "count": len(orders),
+            "buy_count": sides['buy'],
+            "sell_count": sides['sell']
+        })
 
     except Exception as e:
         logger.error(f"Failed to get active orders: {e}")
-        return APIResponse(success=False, error=str(e))
+        return err(str(e))
 
 
 @router.post("/orders/{order_id}/cancel")
@@ -69,8 +62,8 @@ async def cancel_specific_order(order_id: str):
         if not order_id.startswith("manual_"):
             await engine.exchange.cancel_order(order_id, engine.config.symbol)
 
-        # Remove from active orders
-        del engine.active_orders[order_id]
+        # Remove from active orders and the level occupancy index
+        engine.remove_order(order_id)
 
         logger.info(f"Cancelled order {order_id}")
 
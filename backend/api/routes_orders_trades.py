@@ -1,17 +1,24 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, select
 from typing import Optional
 from datetime import datetime
-import json
+from functools import lru_cache
 from ..core.config_models import APIResponse
+from ._responses import ok, err
 from ..core.db import get_db, OrderDB, TradeDB
 from ..engine.services import bot_service
 
 router = APIRouter(prefix="/api", tags=["orders", "trades"])
 
 
-@router.get("/orders")
+@lru_cache(maxsize=256)
+def _parse_since(s: str) -> datetime:
+    """Parse an ISO timestamp, memoized since pollers repeat the same value."""
+    return datetime.fromisoformat(s.replace('Z', '+00:00'))
+
+
+@router.get("/orders", response_model=APIResponse)
 async def get_orders(
     status: Optional[str] = Query(None, description="Filter by order status (open/closed)"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of orders"),
@@ -19,38 +26,41 @@ async def get_orders(
 ):
     """Get orders."""
     try:
-        query = db.query(OrderDB)
+        # Select plain columns instead of hydrating ORM objects
+        stmt = select(
+            OrderDB.id, OrderDB.level_index, OrderDB.zone_id, OrderDB.side,
+            OrderDB.price, OrderDB.size, OrderDB.status, OrderDB.exchange_order_id,
+            OrderDB.ts_open, OrderDB.ts_update
+        )
 
         # Apply filters
         if status:
-            query = query.filter(OrderDB.status == status)
+            stmt = stmt.where(OrderDB.status == status)
 
         # Order by timestamp descending and limit
-        orders = query.order_by(desc(OrderDB.ts_open)).limit(limit).all()
+        rows = db.execute(stmt.order_by(desc(OrderDB.ts_open)).limit(limit)).mappings().all()
 
         # Format orders for response
-        order_data = []
-        for order in orders:
-            order_data.append({
-                "id": order.id,
-                "level_index": order.level_index,
-                "zone_id": order.zone_id,
-                "side": order.side,
-                "price": order.price,
-                "size": order.size,
-                "status": order.status,
-                "exchange_order_id": order.exchange_order_id,
-                "ts_open": order.ts_open.isoformat() if order.ts_open else "",
-                "ts_update": order.ts_update.isoformat() if order.ts_update else ""
-            })
-
-        return APIResponse(success=True, data={"orders": order_data})
+        order_data = [{
+            "id": row["id"],
+            "level_index": row["level_index"],
+            "zone_id": row["zone_id"],
+            "side": row["side"],
+            "price": row["price"],
+            "size": row["size"],
+            "status": row["status"],
+            "exchange_order_id": row["exchange_order_id"],
+            "ts_open": row["ts_open"].isoformat() if row["ts_open"] else "",
+            "ts_update": row["ts_update"].isoformat() if row["ts_update"] else ""
+        } for row in rows]
+
+        return ok({"orders": order_data})
 
     except Exception as e:
-        return APIResponse(success=False, error=str(e))
+        return err(str(e))
 
 
-@router.get("/trades")
+@router.get("/trades", response_model=APIResponse)
 async def get_trades(
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of trades"),
     since: Optional[str] = Query(None, description="ISO timestamp to filter trades since"),
@@ -58,33 +68,34 @@ async def get_trades(
 ):
     """Get trades."""
     try:
-        query = db.query(TradeDB)
+        # Select plain columns instead of hydrating ORM objects
+        stmt = select(
+            TradeDB.id, TradeDB.order_id, TradeDB.side,
+            TradeDB.price, TradeDB.size, TradeDB.fee, TradeDB.ts
+        )
 
         # Apply filters
         if since:
-            since_time = datetime.fromisoformat(since.replace('Z', '+00:00'))
-            query = query.filter(TradeDB.ts >= since_time)
+            stmt = stmt.where(TradeDB.ts >= _parse_since(since))
 
         # Order by timestamp descending and limit
-        trades = query.order_by(desc(TradeDB.ts)).limit(limit).all()
+        rows = db.execute(stmt.order_by(desc(TradeDB.ts)).limit(limit)).mappings().all()
 
         # Format trades for response
-        trade_data = []
-        for trade in trades:
-            trade_data.append({
-                "id": trade.id,
-                "order_id": trade.order_id,
-                "side": trade.side,
-                "price": trade.price,
-                "size": trade.size,
-                "fee": trade.fee,
-                "timestamp": trade.ts.isoformat() if trade.ts else ""
-            })
-
-        return APIResponse(success=True, data={"trades": trade_data})
+        trade_data = [{
+            "id": row["id"],
+            "order_id": row["order_id"],
+            "side": row["side"],
+            "price": row["price"],
+            "size": row["size"],
+            "fee": row["fee"],
+            "timestamp": row["ts"].isoformat() if row["ts"] else ""
+        } for row in rows]
+
+        return ok({"trades": trade_data})
 
     except Exception as e:
-        return APIResponse(success=False, error=str(e))
+        return err(str(e))
 
 
 @router.post("/orders/level/{level_index}/cancel")
@@ -1,12 +1,36 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from ..engine.services import bot_service
-from ..core.config_models import APIResponse
+from ..core.config_models import APIResponse, OrderOut
+from ..engine.exchange_registry import get_exchange_client
+import asyncio
 import os
-from dotenv import load_dotenv
+import time
 
 router = APIRouter(prefix="/api", tags=["status"])
 
+# Environment is loaded once at process start (app.py); read it once here
+EXCHANGE = os.getenv("EXCHANGE", "okx").lower()
+
+# Constant rejection responses, built once instead of per request
+_CONFIRM_REQUIRED = APIResponse(success=False, message="Confirmation required")
+_UNKNOWN_EXCHANGE = APIResponse(success=False, error="Unknown exchange")
+
+# Status responses barely change between UI polls; serve a ~1s cached copy
+# and invalidate explicitly after start/stop/reset.
+_STATUS_TTL = 1.0
+_status_cache = {"exp": 0.0, "payload": None}
+
+
+def _invalidate_status_cache():
+    _status_cache["exp"] = 0.0
+
+
+# Balance responses are cached briefly; the shared registry client backs them.
+_BALANCE_TTL = 5.0
+_balance_cache = {"exp": 0.0, "val": None}
+_balance_lock = asyncio.Lock()
+
 
 class StartRequest(BaseModel):
     confirm: bool
@@ -26,8 +50,13 @@ class ResetRequest(BaseModel):
 async def get_status():
     """Get current bot status."""
     try:
+        now = time.monotonic()
+        if now < _status_cache["exp"]:
+            return _status_cache["payload"]
         status = await bot_service.get_status()
-        return APIResponse(success=True, data=status)
+        _status_cache["payload"] = APIResponse(success=True, data=status)
+        _status_cache["exp"] = now + _STATUS_TTL
+        return _status_cache["payload"]
     except Exception as e:
         return APIResponse(success=False, error=str(e))
 
@@ -36,34 +65,26 @@ async def get_status():
 async def start_bot(request: StartRequest):
     """Start the trading bot."""
     if not request.confirm:
-        return APIResponse(success=False, message="Confirmation required")
+        return _CONFIRM_REQUIRED
 
     result = await bot_service.start_bot(confirm=True)
+    _invalidate_status_cache()
 
-    # Return current orders immediately
+    # Return current orders immediately, reusing the engine's copy-on-write
+    # snapshot: it is rebuilt only when orders actually changed, and its
+    # entries already match OrderOut so model_construct skips re-validation.
     if result["success"]:
-        from ..engine.services import bot_service as service
-        orders_data = {
-            "orders": [],
-            "count": 0
+        engine = bot_service.engine
+        orders = [
+            OrderOut.model_construct(**order_info)
+            for order_info in (engine.orders_snapshot if engine else ())
+            if order_info['status'] == 'open'
+        ]
+        result["orders"] = {
+            "orders": [o.model_dump(mode="json") for o in orders],
+            "count": len(orders)
         }
 
-        if service.engine and service.engine.active_orders:
-            for order_id, order_info in service.engine.active_orders.items():
-                if order_info.get('status') == 'open':
-                    orders_data["orders"].append({
-                        'id': order_id,
-                        'level_index': order_info['level_index'],
-                        'price': order_info['price'],
-                        'side': order_info['side'],
-                        'amount': order_info['size'],
-                        'zone_id': order_info.get('zone_id', 0),
-                        'status': order_info['status']
-                    })
-            orders_data["count"] = len(orders_data["orders"])
-
-        result["orders"] = orders_data
-
     return APIResponse(
         success=result["success"],
         message=result["message"],
@@ -75,9 +96,10 @@ async def start_bot(request: StartRequest):
 async def stop_bot(request: StopRequest):
     """Stop the trading bot."""
     if not request.confirm:
-        return APIResponse(success=False, message="Confirmation required")
+        return _CONFIRM_REQUIRED
 
     result = await bot_service.stop_bot(confirm=True)
+    _invalidate_status_cache()
     return APIResponse(
         success=result["success"],
         message=result["message"]
@@ -88,13 +110,14 @@ async def stop_bot(request: StopRequest):
 async def reset_bot(request: ResetRequest):
     """Reset the bot (clear and reinitialize)."""
     if not request.confirm:
-        return APIResponse(success=False, message="Confirmation required")
+        return _CONFIRM_REQUIRED
 
     result = await bot_service.reset_bot(
         confirm=True,
         clear_positions=request.clear_positions and not request.cancel_only,
         cancel_only=request.cancel_only
     )
+    _invalidate_status_cache()
     return APIResponse(
         success=result["success"],
         message=result["message"]
@@ -105,26 +128,29 @@ async def reset_bot(request: ResetRequest):
 async def get_balance():
     """Get account balance from exchange."""
     try:
-        load_dotenv()
-        exchange = os.getenv("EXCHANGE", "okx")
-
-        if exchange == "okx":
-            from ..engine.exchange_okx_ccxt import OKXExchange
-            exchange_client = OKXExchange()
-        elif exchange == "bitkub":
-            from ..engine.exchange_bitkub import BitkubExchange
-            exchange_client = BitkubExchange()
-        else:
-            return APIResponse(success=False, error="Unknown exchange")
-
-        balance = await exchange_client.fetch_balance()
-        await exchange_client.close()
-
-        # Return only non-zero balances
-        non_zero_balance = {}
-        for currency, amount in balance.get('total', {}).items():
-            if amount > 0:
-                non_zero_balance[currency] = amount
+        if time.monotonic() < _balance_cache["exp"]:
+            return APIResponse(success=True, data=_balance_cache["val"])
+
+        if EXCHANGE not in ("okx", "bitkub"):
+            return _UNKNOWN_EXCHANGE
+
+        async with _balance_lock:
+            # Re-check after the wait: another request may have refreshed it
+            now = time.monotonic()
+            if now < _balance_cache["exp"]:
+                return APIResponse(success=True, data=_balance_cache["val"])
+
+            exchange_client = get_exchange_client(EXCHANGE)
+            balance = await exchange_client.fetch_balance()
+
+            # Return only non-zero balances
+            non_zero_balance = {}
+            for currency, amount in balance.get('total', {}).items():
+                if amount > 0:
+                    non_zero_balance[currency] = amount
+
+            _balance_cache["val"] = non_zero_balance
+            _balance_cache["exp"] = now + _BALANCE_TTL
 
         return APIResponse(success=True, data=non_zero_balance)
 
@@ -1,8 +1,12 @@
-from fastapi import APIRouter
+import numpy as np
+from fastapi import APIRouter, Depends
 from pydantic import BaseModel
+from sqlalchemy.orm import Session
 from typing import List, Dict
 from ..core.config_models import APIResponse
+from ..core.db import get_db, replace_manual_sync_orders
 from ..engine.services import bot_service
+from ..engine.grid_engine import OrderRecord
 from ..core.logging import logger
 
 router = APIRouter(prefix="/api", tags=["sync"])
@@ -19,8 +23,16 @@ class ManualSyncRequest(BaseModel):
     orders: List[ManualOrder]
 
 
+def _closest_levels(levels_np: np.ndarray, prices: List[float]) -> np.ndarray:
+    """Vectorized nearest-level lookup for a batch of order prices."""
+    arr = np.fromiter(prices, dtype=np.float64, count=len(prices))
+    hi = np.clip(np.searchsorted(levels_np, arr), 0, len(levels_np) - 1)
+    lo = np.clip(hi - 1, 0, len(levels_np) - 1)
+    return np.where(np.abs(levels_np[hi] - arr) < np.abs(levels_np[lo] - arr), hi, lo)
+
+
 @router.post("/sync/manual")
-async def manual_sync_orders(request: ManualSyncRequest):
+async def manual_sync_orders(request: ManualSyncRequest, db: Session = Depends(get_db)):
     """Manually sync orders from user input when API returns empty."""
     try:
         # Get the engine
@@ -29,62 +41,53 @@ async def manual_sync_orders(request: ManualSyncRequest):
         if not engine.levels:
             return APIResponse(success=False, error="Grid engine not initialized")
 
-        # Clear existing orders
+        # Clear existing orders and the level occupancy index together
         engine.active_orders.clear()
+        engine.level_to_order_id.clear()
 
         # Map manual orders to grid levels - keep each order separate
         synced_count = 0
-        for idx, order in enumerate(request.orders):
-            # Find closest grid level
-            closest_level = None
-            min_diff = float('inf')
-            for i, level_price in enumerate(engine.levels):
-                diff = abs(order.price - level_price)
-                if diff < min_diff:
-                    min_diff = diff
-                    closest_level = i
-
-            if closest_level is not None:
-                # Use the actual order ID from exchange
-                order_id = order.id
-                engine.active_orders[order_id] = {
-                    'id': order_id,
-                    'level_index': closest_level,
-                    'zone_id': engine.zone_map.get(closest_level, {}).get('zone_id', 0),
-                    'side': order.side,
-                    'price': order.price,
-                    'size': order.amount,
-                    'status': 'open'
-                }
-                synced_count += 1
-                logger.info(f"Manually synced order {order_id} at price {order.price} to level {closest_level}")
-
-        # Update active levels
-        active_levels = list(set(order_info['level_index'] for order_info in engine.active_orders.values()))
+        level_set = set()
+        # One searchsorted call over the cached ndarray handles all orders
+        level_indices = _closest_levels(engine._levels_np, [o.price for o in request.orders])
+        for order, closest_level in zip(request.orders, level_indices):
+            closest_level = int(closest_level)
+            level_set.add(closest_level)
+
+            # Use the actual order ID from exchange
+            order_id = order.id
+            engine.active_orders[order_id] = OrderRecord(
+                level_index=closest_level,
+                zone_id=engine.zone_map.get(closest_level, {}).get('zone_id', 0),
+                side=order.side,
+                price=order.price,
+                size=order.amount
+            )
+            engine.level_to_order_id[closest_level] = order_id
+            synced_count += 1
+            logger.info(f"Manually synced order {order_id} at price {order.price} to level {closest_level}")
+
+        engine.mark_orders_dirty()
+
+        # Update active levels (collected during the assignment loop)
+        active_levels = list(level_set)
         from ..core.state import state_manager
         await state_manager.set_active_levels(active_levels)
 
-        # Save synced orders to file for persistence
-        import json
-        import os
-        sync_file = "manual_sync_orders.json"
-        sync_data = {
-            "orders": [
-                {
-                    "id": order_info['id'],
-                    "level_index": order_info['level_index'],
-                    "price": order_info['price'],
-                    "side": order_info['side'],
-                    "size": order_info['size'],
-                    "zone_id": order_info['zone_id']
-                }
-                for order_info in engine.active_orders.values()
-            ]
-        }
-        with open(sync_file, 'w') as f:
-            json.dump(sync_data, f)
-
-        logger.info(f"Manually synced {synced_count} orders and saved to {sync_file}")
+        # Persist synced orders in one bulk transaction
+        replace_manual_sync_orders(db, [
+            {
+                "id": order_id,
+                "level_index": order_info.level_index,
+                "zone_id": order_info.zone_id,
+                "side": order_info.side,
+                "price": order_info.price,
+                "size": order_info.size
+            }
+            for order_id, order_info in engine.active_orders.items()
+        ])
+
+        logger.info(f"Manually synced {synced_count} orders and saved to database")
 
         return APIResponse(
             success=True,
@@ -98,21 +101,25 @@ async def manual_sync_orders(request: ManualSyncRequest):
 
 
 @router.delete("/sync/manual")
-async def clear_manual_sync():
+async def clear_manual_sync(db: Session = Depends(get_db)):
     """Clear manually synced orders."""
     try:
         # Clear from engine
         engine = bot_service.engine
         if engine:
             engine.active_orders.clear()
+            engine.level_to_order_id.clear()
+            engine.mark_orders_dirty()
             logger.info("Cleared active orders from engine")
 
-        # Delete saved file
+        # Clear persisted rows, plus the legacy JSON file if still around
+        replace_manual_sync_orders(db, [])
+
         import os
         sync_file = "manual_sync_orders.json"
         if os.path.exists(sync_file):
             os.remove(sync_file)
-            logger.info(f"Deleted {sync_file}")
+            logger.info(f"Deleted legacy {sync_file}")
 
         return APIResponse(
             success=True,
@@ -1,49 +1,100 @@
 from fastapi import WebSocket, WebSocketDisconnect
-from typing import List
-import json
+from typing import Dict
+import asyncio
+import orjson
+import time
 from ..core.logging import logger
 
+# Message types where only the newest value matters; older queued copies
+# are dropped instead of being sent one by one.
+_REPLACEABLE_TYPES = frozenset({"status", "state_update", "orders_snapshot"})
+
+# Coalescing window: wait one frame (~16 ms) after the first queued message
+# so bursts collapse into a single flush.
+_FLUSH_WINDOW = 0.016
+
+# Per-client backlog bound; when full the oldest message is dropped.
+_QUEUE_MAXSIZE = 64
+
 
 class ConnectionManager:
-    """WebSocket connection manager."""
+    """WebSocket connection manager with per-client coalescing queues."""
 
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        # websocket -> connect time; dict keeps membership and removal O(1)
+        self.active_connections: Dict[WebSocket, float] = {}
+        self.queues: Dict[WebSocket, asyncio.Queue] = {}
+        self._flushers: Dict[WebSocket, asyncio.Task] = {}
 
     async def connect(self, websocket: WebSocket):
         """Accept and track WebSocket connection."""
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections[websocket] = time.monotonic()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_QUEUE_MAXSIZE)
+        self.queues[websocket] = queue
+        self._flushers[websocket] = asyncio.create_task(
+            self._flush_client(websocket, queue)
+        )
         logger.info(f"WebSocket client connected. Total clients: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
         """Remove disconnected WebSocket."""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        if self.active_connections.pop(websocket, None) is not None:
             logger.info(f"WebSocket client disconnected. Total clients: {len(self.active_connections)}")
+        self.queues.pop(websocket, None)
+        flusher = self._flushers.pop(websocket, None)
+        if flusher is not None:
+            flusher.cancel()
 
     async def send_personal_message(self, message: str, websocket: WebSocket):
         """Send message to specific client."""
         await websocket.send_text(message)
 
     async def broadcast(self, message: dict):
-        """Broadcast message to all connected clients."""
-        if not self.active_connections:
-            return
-
-        message_str = json.dumps(message)
-        disconnected = []
-
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message_str)
-            except Exception as e:
-                logger.error(f"Error broadcasting to client: {e}")
-                disconnected.append(connection)
-
-        # Remove disconnected clients
-        for conn in disconnected:
-            self.disconnect(conn)
+        """Queue a message for every connected client.
+
+        Sends happen in per-client flusher tasks, so a slow peer never
+        blocks the broadcaster or other clients.
+        """
+        for queue in list(self.queues.values()):
+            if queue.full():
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+            queue.put_nowait(message)
+
+    async def _flush_client(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Drain a client's queue, coalescing bursts into fewer sends."""
+        try:
+            while True:
+                batch = [await queue.get()]
+                # Let a burst accumulate, then drain whatever arrived
+                await asyncio.sleep(_FLUSH_WINDOW)
+                while True:
+                    try:
+                        batch.append(queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+                # Keep only the newest message per replaceable type
+                seen = set()
+                merged = []
+                for msg in reversed(batch):
+                    msg_type = msg.get("type")
+                    if msg_type in _REPLACEABLE_TYPES:
+                        if msg_type in seen:
+                            continue
+                        seen.add(msg_type)
+                    merged.append(msg)
+
+                for msg in reversed(merged):
+                    await websocket.send_bytes(orjson.dumps(msg))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error broadcasting to client: {e}")
+            self.disconnect(websocket)
 
 
 # Global connection manager
@@ -81,4 +132,4 @@ async def handle_websocket(websocket: WebSocket):
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
         manager.disconnect(websocket)
-        bot_service.remove_ws_client(websocket)
\ No newline at end of file
+        bot_service.remove_ws_client(websocket)
@@ -1,9 +1,10 @@
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import ORJSONResponse
+import asyncio
 import os
-import json
+import orjson
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -22,14 +23,18 @@ from backend.api.ws import handle_websocket
 
 # Import services
 from backend.engine.services import bot_service
-from backend.core.config_models import GridConfig
+from backend.engine.grid_engine import OrderRecord
+from backend.engine.exchange_registry import close_all_clients
+from backend.core.config_models import GridConfig, CONFIG_ADAPTER
+from backend.core.db import SessionLocal, load_manual_sync_orders, replace_manual_sync_orders, db_writer_task
 from backend.core.logging import logger
 
 # Create FastAPI app
 app = FastAPI(
     title="Grid Trading Bot",
     version="1.0.0",
-    description="Static Grid Trading System with OKX and Bitkub support"
+    description="Static Grid Trading System with OKX and Bitkub support",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -58,62 +63,69 @@ async def websocket_endpoint(websocket: WebSocket):
 
 # Serve frontend files
 frontend_path = Path(__file__).parent.parent / "frontend"
-if frontend_path.exists():
-    # Mount CSS and JS files
-    @app.get("/styles.css")
-    async def serve_css():
-        return FileResponse(str(frontend_path / "styles.css"), media_type="text/css")
-
-    @app.get("/app.js")
-    async def serve_app_js():
-        return FileResponse(str(frontend_path / "app.js"), media_type="application/javascript")
-
-    # Serve component files
-    @app.get("/components/{filename}")
-    async def serve_component(filename: str):
-        return FileResponse(str(frontend_path / "components" / filename), media_type="application/javascript")
-
-    # Serve index.html
-    @app.get("/")
-    async def serve_frontend():
-        """Serve frontend index.html."""
-        return FileResponse(str(frontend_path / "index.html"))
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles with browser caching for CSS/JS assets."""
+
+    async def get_response(self, path: str, scope):
+        response = await super().get_response(path, scope)
+        if path.endswith((".css", ".js")):
+            response.headers["cache-control"] = "public, max-age=86400"
+        return response
+
+# Background task batching DB writes; started on startup, cancelled on shutdown
+_db_writer: asyncio.Task = None
+
 
 # Startup event
 @app.on_event("startup")
 async def startup_event():
     """Initialize bot on startup."""
+    global _db_writer
     logger.info("Starting Grid Trading Bot API...")
 
+    _db_writer = asyncio.create_task(db_writer_task())
+
     # Load config from file if exists
     config_file = "config.json"
     if os.path.exists(config_file):
         try:
-            with open(config_file, 'r') as f:
-                config_data = json.load(f)
-                config = GridConfig(**config_data)
+            with open(config_file, 'rb') as f:
+                config = CONFIG_ADAPTER.validate_json(f.read())
                 await bot_service.initialize(config)
                 logger.info("Bot initialized with saved configuration")
 
-                # Load manually synced orders if exists
-                sync_file = "manual_sync_orders.json"
-                if os.path.exists(sync_file):
+                # Load manually synced orders from the database
+                try:
+                    db = SessionLocal()
                     try:
-                        with open(sync_file, 'r') as f:
-                            sync_data = json.load(f)
-                            for order in sync_data.get('orders', []):
-                                bot_service.engine.active_orders[order['id']] = {
-                                    'id': order['id'],
-                                    'level_index': order['level_index'],
-                                    'price': order['price'],
-                                    'side': order['side'],
-                                    'size': order['size'],
-                                    'zone_id': order['zone_id'],
-                                    'status': 'open'
-                                }
-                            logger.info(f"Loaded {len(sync_data.get('orders', []))} manually synced orders")
-                    except Exception as e:
-                        logger.error(f"Failed to load manual sync orders: {e}")
+                        orders = load_manual_sync_orders(db)
+
+                        # One-time migration from the legacy JSON file
+                        sync_file = "manual_sync_orders.json"
+                        if not orders and os.path.exists(sync_file):
+                            with open(sync_file, 'rb') as f:
+                                orders = orjson.loads(f.read()).get('orders', [])
+                            replace_manual_sync_orders(db, orders)
+                            os.remove(sync_file)
+                            logger.info(f"Migrated {len(orders)} manual sync orders from {sync_file} to database")
+
+                        for order in orders:
+                            bot_service.engine.active_orders[order['id']] = OrderRecord(
+                                level_index=order['level_index'],
+                                zone_id=order['zone_id'],
+                                side=order['side'],
+                                price=order['price'],
+                                size=order['size']
+                            )
+                            bot_service.engine.level_to_order_id[order['level_index']] = order['id']
+                        bot_service.engine.mark_orders_dirty()
+                        logger.info(f"Loaded {len(orders)} manually synced orders")
+                    finally:
+                        db.close()
+                except Exception as e:
+                    logger.error(f"Failed to load manual sync orders: {e}")
 
         except Exception as e:
             logger.error(f"Failed to load config: {e}")
@@ -142,14 +154,38 @@ async def startup_event():
 async def shutdown_event():
     """Clean up on shutdown."""
     logger.info("Shutting down Grid Trading Bot API...")
+    await close_all_clients()
     await bot_service.close()
 
+    # Stop the batched DB writer; its teardown flushes anything still queued
+    if _db_writer is not None:
+        _db_writer.cancel()
+        try:
+            await _db_writer
+        except asyncio.CancelledError:
+            pass
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "service": "Grid Trading Bot"}
 
+# Mounted last so /api/* and /health routes keep precedence; html=True
+# serves index.html at /
+if frontend_path.exists():
+    app.mount("/", CachedStaticFiles(directory=str(frontend_path), html=True), name="frontend")
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=9000, reload=True)
\ No newline at end of file
+    # uvloop + httptools come with uvicorn[standard]; reload is a dev-only
+    # feature that forks a file watcher and re-imports the app on changes.
+    # Keep a single worker: WebSocket fan-out is in-process.
+    uvicorn.run(
+        "backend.app:app",
+        host="0.0.0.0",
+        port=9000,
+        reload=False,
+        loop="uvloop",
+        http="httptools"
+    )
\ No newline at end of file
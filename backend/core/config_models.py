@@ -1,10 +1,12 @@
 from typing import Literal, List, Optional
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_validator
 from decimal import Decimal
 
 
 class ZoneDef(BaseModel):
     """Zone definition for grid levels."""
+    model_config = ConfigDict(extra='forbid')
+
     id: int
     level_start: int
     level_end: int
@@ -19,6 +21,10 @@ class ZoneDef(BaseModel):
 
 class GridConfig(BaseModel):
     """Grid trading configuration."""
+    # forbid catches typoed fields at the PUT /config boundary instead of
+    # silently dropping them; whitespace stripping normalizes symbols
+    model_config = ConfigDict(extra='forbid', str_strip_whitespace=True)
+
     upper_bound: float = Field(gt=0, description="Upper price boundary")
     lower_bound: float = Field(gt=0, description="Lower price boundary")
     total_levels: int = Field(ge=2, description="Total number of grid levels")
@@ -32,6 +38,7 @@ class GridConfig(BaseModel):
     exchange: Literal["okx", "bitkub"] = "okx"
     network: Optional[Literal["live", "demo"]] = "live"
     symbol: str = "BTC/USDT"
+    poll_interval: float = Field(default=5.0, gt=0, description="Order monitor poll interval in seconds (REST fallback)")
 
     @model_validator(mode='after')
     def validate_bounds(self):
@@ -46,6 +53,11 @@ class GridConfig(BaseModel):
         return self
 
 
+# Compiled once at import; validate_json parses config bytes directly in
+# pydantic-core without an intermediate Python dict
+CONFIG_ADAPTER = TypeAdapter(GridConfig)
+
+
 class RuntimeState(BaseModel):
     """Runtime state of the bot."""
     state: Literal["STOPPED", "STARTING", "RUNNING", "STOPPING", "ERROR", "SIM_RUNNING"] = "STOPPED"
@@ -93,6 +105,17 @@ class TradeModel(BaseModel):
     ts: str
 
 
+class OrderOut(BaseModel):
+    """Active-order shape returned by status/order endpoints."""
+    id: str
+    level_index: int
+    price: float
+    side: str
+    amount: float
+    zone_id: int = 0
+    status: str = "open"
+
+
 class APIResponse(BaseModel):
     """Standard API response."""
     success: bool = True
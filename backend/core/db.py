@@ -1,17 +1,39 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text, Boolean
+from sqlalchemy import create_engine, event, Column, Integer, String, Float, DateTime, Text, Boolean, Index, JSON, delete, insert, select
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.sql import func
+from collections import defaultdict
 from datetime import datetime
+import asyncio
 import json
 import os
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DB_URL", "sqlite:///./grid.db")
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {})
+if "sqlite" in DATABASE_URL:
+    engine = create_engine(
+        DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        pool_pre_ping=True
+    )
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, _):
+        # WAL halves per-commit fsync cost and lets readers run during writes
+        cur = dbapi_conn.cursor()
+        cur.execute("PRAGMA journal_mode=WAL")
+        cur.execute("PRAGMA synchronous=NORMAL")
+        cur.execute("PRAGMA temp_store=MEMORY")
+        cur.execute("PRAGMA cache_size=-20000")  # 20MB page cache
+        cur.close()
+else:
+    engine = create_engine(DATABASE_URL, pool_pre_ping=True)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -23,11 +45,15 @@ class ActionLogDB(Base):
     ts = Column(DateTime(timezone=True), server_default=func.now())
     user = Column(String, default="local")
     action = Column(String, nullable=False)
-    params = Column(Text, default="{}")
+    # Native JSON so the driver decodes params; no json.loads per row in /logs
+    params = Column(JSON, default=dict)
     result = Column(Text, default="")
     mode = Column(String, default="")
     exchange = Column(String, default="")
 
+    # Serves the /logs action filter + ts DESC sort without a table scan
+    __table_args__ = (Index('ix_actionlog_action_ts', 'action', ts.desc()),)
+
 
 class OrderDB(Base):
     __tablename__ = "orders"
@@ -43,6 +69,9 @@ class OrderDB(Base):
     ts_open = Column(DateTime(timezone=True), server_default=func.now())
     ts_update = Column(DateTime(timezone=True), onupdate=func.now())
 
+    # Serves the /orders status filter + ts_open DESC sort
+    __table_args__ = (Index('ix_orders_status_tsopen', 'status', ts_open.desc()),)
+
 
 class TradeDB(Base):
     __tablename__ = "trades"
@@ -55,6 +84,20 @@ class TradeDB(Base):
     fee = Column(Float, default=0.0)
     ts = Column(DateTime(timezone=True), server_default=func.now())
 
+    # Serves the /trades since filter + ts DESC sort
+    __table_args__ = (Index('ix_trades_ts', ts.desc()),)
+
+
+class ManualSyncOrderDB(Base):
+    __tablename__ = "manual_sync_orders"
+
+    id = Column(String, primary_key=True)
+    level_index = Column(Integer, nullable=False)
+    zone_id = Column(Integer, default=0)
+    side = Column(String, nullable=False)
+    price = Column(Float, nullable=False)
+    size = Column(Float, nullable=False)
+
 
 class ConfigHistoryDB(Base):
     __tablename__ = "config_history"
@@ -89,16 +132,104 @@ def get_db() -> Session:
         db.close()
 
 
+# Batched writer: while the writer task runs, save_* helpers enqueue rows
+# here instead of paying one commit (and one fsync) per call. Outside the
+# app (tests, scripts) the helpers fall back to the direct synchronous path.
+db_write_queue: asyncio.Queue = asyncio.Queue()
+_BATCH_MAX_ROWS = 200
+_BATCH_WINDOW = 0.1
+_writer_running = False
+_writer_loop: asyncio.AbstractEventLoop = None
+
+_WRITE_MODELS = {
+    "action_log": ActionLogDB,
+    "order": OrderDB,
+    "trade": TradeDB,
+    "state_snapshot": StateSnapshotDB,
+}
+
+
+def _enqueue(kind: str, row: dict) -> bool:
+    loop = _writer_loop
+    if not _writer_running or loop is None:
+        return False
+    # asyncio.Queue is not thread-safe: callers running in a worker thread
+    # (e.g. save_* dispatched via asyncio.to_thread) must hand the row to the
+    # writer's loop instead of touching the queue directly.
+    try:
+        on_writer_loop = asyncio.get_running_loop() is loop
+    except RuntimeError:
+        on_writer_loop = False
+    if on_writer_loop:
+        db_write_queue.put_nowait((kind, row))
+    else:
+        loop.call_soon_threadsafe(db_write_queue.put_nowait, (kind, row))
+    return True
+
+
+def _flush_rows(items: list):
+    """Insert queued rows grouped by model in a single transaction."""
+    grouped = defaultdict(list)
+    for kind, row in items:
+        grouped[kind].append(row)
+    db = SessionLocal()
+    try:
+        for kind, rows in grouped.items():
+            db.execute(insert(_WRITE_MODELS[kind]), rows)
+        db.commit()
+    finally:
+        db.close()
+
+
+async def db_writer_task():
+    """Drain the write queue in batches of up to 200 rows or every 100 ms."""
+    global _writer_running, _writer_loop
+    _writer_loop = asyncio.get_running_loop()
+    _writer_running = True
+    try:
+        while True:
+            items = [await db_write_queue.get()]
+            deadline = time.monotonic() + _BATCH_WINDOW
+            while len(items) < _BATCH_MAX_ROWS:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(await asyncio.wait_for(db_write_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            await asyncio.to_thread(_flush_rows, items)
+    finally:
+        _writer_running = False
+        _writer_loop = None
+        flush_db_writes()
+
+
+def flush_db_writes():
+    """Write anything still queued; called when the writer stops."""
+    items = []
+    while True:
+        try:
+            items.append(db_write_queue.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+    if items:
+        _flush_rows(items)
+
+
 def save_action_log(db: Session, action: str, params: dict = None, result: str = "", mode: str = "", exchange: str = "", user: str = "local"):
     """Save an action log entry."""
-    log = ActionLogDB(
-        action=action,
-        params=json.dumps(params or {}),
-        result=result,
-        mode=mode,
-        exchange=exchange,
-        user=user
-    )
+    row = {
+        "action": action,
+        "params": params or {},
+        "result": result,
+        "mode": mode,
+        "exchange": exchange,
+        "user": user
+    }
+    if _enqueue("action_log", row):
+        return None
+    log = ActionLogDB(**row)
     db.add(log)
     db.commit()
     return log
@@ -106,14 +237,17 @@ def save_action_log(db: Session, action: str, params: dict = None, result: str =
 
 def save_order(db: Session, level_index: int, zone_id: int, side: str, price: float, size: float, exchange_order_id: str = None):
     """Save an order."""
-    order = OrderDB(
-        level_index=level_index,
-        zone_id=zone_id,
-        side=side,
-        price=price,
-        size=size,
-        exchange_order_id=exchange_order_id
-    )
+    row = {
+        "level_index": level_index,
+        "zone_id": zone_id,
+        "side": side,
+        "price": price,
+        "size": size,
+        "exchange_order_id": exchange_order_id
+    }
+    if _enqueue("order", row):
+        return None
+    order = OrderDB(**row)
     db.add(order)
     db.commit()
     return order
@@ -121,18 +255,38 @@ def save_order(db: Session, level_index: int, zone_id: int, side: str, price: fl
 
 def save_trade(db: Session, order_id: int, side: str, price: float, size: float, fee: float = 0.0):
     """Save a trade."""
-    trade = TradeDB(
-        order_id=order_id,
-        side=side,
-        price=price,
-        size=size,
-        fee=fee
-    )
+    row = {
+        "order_id": order_id,
+        "side": side,
+        "price": price,
+        "size": size,
+        "fee": fee
+    }
+    if _enqueue("trade", row):
+        return None
+    trade = TradeDB(**row)
     db.add(trade)
     db.commit()
     return trade
 
 
+def replace_manual_sync_orders(db: Session, orders: list):
+    """Replace all manually synced orders in a single transaction."""
+    db.execute(delete(ManualSyncOrderDB))
+    if orders:
+        db.execute(insert(ManualSyncOrderDB), orders)
+    db.commit()
+
+
+def load_manual_sync_orders(db: Session) -> list:
+    """Load manually synced orders as plain dicts."""
+    stmt = select(
+        ManualSyncOrderDB.id, ManualSyncOrderDB.level_index, ManualSyncOrderDB.zone_id,
+        ManualSyncOrderDB.side, ManualSyncOrderDB.price, ManualSyncOrderDB.size
+    )
+    return [dict(row) for row in db.execute(stmt).mappings().all()]
+
+
 def save_config_history(db: Session, config: dict, user: str = "local"):
     """Save config history."""
     history = ConfigHistoryDB(
@@ -146,13 +300,16 @@ def save_config_history(db: Session, config: dict, user: str = "local"):
 
 def save_state_snapshot(db: Session, state: str, active_levels: list, pnl_realized: float, pnl_unrealized: float, inventory: dict):
     """Save state snapshot."""
-    snapshot = StateSnapshotDB(
-        state=state,
-        active_levels=json.dumps(active_levels),
-        pnl_realized=pnl_realized,
-        pnl_unrealized=pnl_unrealized,
-        inventory=json.dumps(inventory)
-    )
+    row = {
+        "state": state,
+        "active_levels": json.dumps(active_levels),
+        "pnl_realized": pnl_realized,
+        "pnl_unrealized": pnl_unrealized,
+        "inventory": json.dumps(inventory)
+    }
+    if _enqueue("state_snapshot", row):
+        return None
+    snapshot = StateSnapshotDB(**row)
     db.add(snapshot)
     db.commit()
     return snapshot
\ No newline at end of file
@@ -1,21 +1,37 @@
 import logging
 import sys
-from datetime import datetime
-import json
+import time
+import orjson
+
+# Cache the second-granularity ISO prefix: within one second only the
+# microsecond suffix changes, so chatty logging skips strftime entirely.
+_iso_cache = (-1, "")
+
+
+def _fast_iso(ts: float) -> str:
+    """ISO-8601 UTC timestamp without per-record datetime allocation."""
+    global _iso_cache
+    sec = int(ts)
+    cached_sec, prefix = _iso_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _iso_cache = (sec, prefix)
+    return f"{prefix}.{int((ts - sec) * 1e6):06d}"
+
 
 class JSONFormatter(logging.Formatter):
     """JSON log formatter."""
 
     def format(self, record):
         log_obj = {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': _fast_iso(record.created),
             'level': record.levelname,
             'module': record.module,
             'message': record.getMessage(),
         }
         if hasattr(record, 'extra'):
             log_obj.update(record.extra)
-        return json.dumps(log_obj)
+        return orjson.dumps(log_obj).decode()
 
 
 def setup_logger(name: str = "grid_bot", level: int = logging.INFO) -> logging.Logger:
@@ -31,4 +47,4 @@ def setup_logger(name: str = "grid_bot", level: int = logging.INFO) -> logging.L
     return logger
 
 
-logger = setup_logger()
\ No newline at end of file
+logger = setup_logger()
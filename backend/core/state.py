@@ -4,6 +4,9 @@ import json
 from .config_models import RuntimeState, GridConfig
 from .logging import logger
 
+# Subscribers failing this many times in a row are dropped
+_MAX_NOTIFY_FAILURES = 3
+
 
 class StateManager:
     """Manages bot runtime state."""
@@ -12,12 +15,25 @@ class StateManager:
         self._state = RuntimeState()
         self._config: Optional[GridConfig] = None
         self._lock = asyncio.Lock()
-        self._subscribers = []
+        # Dict used as an ordered set: O(1) add/remove with deterministic
+        # (insertion-order) notify dispatch
+        self._subscribers: Dict = {}
+        self._subscriber_failures: Dict = {}
+        # Immutable-by-convention snapshot, rebound atomically on every
+        # write so readers never need the lock
+        self._snapshot: dict = self._state.model_dump()
+
+    def _update_snapshot(self):
+        """Rebind the read snapshot; called after mutations under the lock."""
+        self._snapshot = self._state.model_dump()
 
     async def get_state(self) -> RuntimeState:
         """Get current state."""
-        async with self._lock:
-            return self._state.model_copy()
+        return RuntimeState.model_validate(self._snapshot)
+
+    def get_state_dict(self) -> dict:
+        """Current state as a plain dict, skipping model revalidation."""
+        return self._snapshot
 
     async def set_state(self, state: str):
         """Set bot state."""
@@ -25,7 +41,8 @@ class StateManager:
             old_state = self._state.state
             self._state.state = state
             logger.info(f"State transition: {old_state} -> {state}")
-            await self._notify_subscribers({"type": "state_change", "old": old_state, "new": state})
+            self._update_snapshot()
+        await self._notify_subscribers({"type": "state_change", "old": old_state, "new": state})
 
     async def update_pnl(self, realized: float = None, unrealized: float = None):
         """Update PnL values."""
@@ -34,19 +51,23 @@ class StateManager:
                 self._state.pnl_realized = realized
             if unrealized is not None:
                 self._state.pnl_unrealized = unrealized
-            await self._notify_subscribers({"type": "pnl_update", "realized": self._state.pnl_realized, "unrealized": self._state.pnl_unrealized})
+            event = {"type": "pnl_update", "realized": self._state.pnl_realized, "unrealized": self._state.pnl_unrealized}
+            self._update_snapshot()
+        await self._notify_subscribers(event)
 
     async def update_inventory(self, inventory: dict):
         """Update inventory."""
         async with self._lock:
             self._state.inventory = inventory
-            await self._notify_subscribers({"type": "inventory_update", "inventory": inventory})
+            self._update_snapshot()
+        await self._notify_subscribers({"type": "inventory_update", "inventory": inventory})
 
     async def set_active_levels(self, levels: List[int]):
         """Set active grid levels."""
         async with self._lock:
             self._state.active_levels = levels
-            await self._notify_subscribers({"type": "levels_update", "levels": levels})
+            self._update_snapshot()
+        await self._notify_subscribers({"type": "levels_update", "levels": levels})
 
     async def set_error(self, error: str):
         """Set error state."""
@@ -54,29 +75,46 @@ class StateManager:
             self._state.state = "ERROR"
             self._state.last_error = error
             logger.error(f"Bot error: {error}")
-            await self._notify_subscribers({"type": "error", "message": error})
+            self._update_snapshot()
+        await self._notify_subscribers({"type": "error", "message": error})
 
     async def clear_error(self):
         """Clear error state."""
         async with self._lock:
             self._state.last_error = None
+            self._update_snapshot()
 
     def subscribe(self, callback):
         """Subscribe to state changes."""
-        self._subscribers.append(callback)
+        self._subscribers[callback] = None
 
     def unsubscribe(self, callback):
         """Unsubscribe from state changes."""
-        if callback in self._subscribers:
-            self._subscribers.remove(callback)
+        self._subscribers.pop(callback, None)
+        self._subscriber_failures.pop(callback, None)
 
     async def _notify_subscribers(self, event: dict):
-        """Notify all subscribers of state changes."""
-        for callback in self._subscribers:
-            try:
-                await callback(event)
-            except Exception as e:
-                logger.error(f"Error notifying subscriber: {e}")
+        """Notify all subscribers concurrently; one slow consumer no longer
+        stalls the rest, and the lock is already released by the caller."""
+        if not self._subscribers:
+            return
+        subscribers = list(self._subscribers)
+        await asyncio.gather(*(self._safe_notify(callback, event) for callback in subscribers))
+
+    async def _safe_notify(self, callback, event: dict):
+        """Invoke one subscriber, dropping it after repeated failures."""
+        try:
+            await callback(event)
+        except Exception as e:
+            logger.error(f"Error notifying subscriber: {e}")
+            failures = self._subscriber_failures.get(callback, 0) + 1
+            if failures >= _MAX_NOTIFY_FAILURES:
+                logger.warning("Dropping subscriber after repeated notify failures")
+                self.unsubscribe(callback)
+            else:
+                self._subscriber_failures[callback] = failures
+        else:
+            self._subscriber_failures.pop(callback, None)
 
     def set_config(self, config: GridConfig):
         """Set grid configuration."""
@@ -90,7 +128,8 @@ class StateManager:
         """Reset state to initial values."""
         async with self._lock:
             self._state = RuntimeState()
-            await self._notify_subscribers({"type": "reset"})
+            self._update_snapshot()
+        await self._notify_subscribers({"type": "reset"})
 
 
-state_manager = StateManager()
\ No newline at end of file
+state_manager = StateManager()
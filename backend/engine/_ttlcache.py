@@ -0,0 +1,43 @@
+"""Tiny async TTL cache with single-flight refresh for exchange connectors.
+
+Market metadata changes roughly daily while tickers move sub-second, so
+each endpoint gets its own TTL (env-tunable). Concurrent callers for the
+same key collapse to one network request behind a per-key lock.
+"""
+import asyncio
+import os
+import time
+
+MARKETS_TTL = float(os.getenv("CACHE_TTL_MARKETS", "3600"))
+TICKER_TTL = float(os.getenv("CACHE_TTL_TICKERS", "0.25"))
+
+
+class TTLCache:
+    """Per-key TTL cache; get() deduplicates concurrent refreshes."""
+
+    def __init__(self):
+        self._entries = {}  # key -> (expires, value)
+        self._locks = {}    # key -> asyncio.Lock
+
+    async def get(self, key: str, ttl: float, fetch):
+        """Return the cached value for key, or await fetch() to refresh it."""
+        entry = self._entries.get(key)
+        if entry and time.monotonic() < entry[0]:
+            return entry[1]
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Re-check after the wait: another caller may have refreshed it
+            entry = self._entries.get(key)
+            now = time.monotonic()
+            if entry and now < entry[0]:
+                return entry[1]
+            value = await fetch()
+            self._entries[key] = (now + ttl, value)
+            return value
+
+    def invalidate(self, key: str = None):
+        """Drop one key, or everything when no key is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
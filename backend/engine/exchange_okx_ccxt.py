@@ -1,8 +1,12 @@
-import ccxt
+import asyncio
+# ccxt.pro extends the async client with websocket watch_* streams while
+# keeping every REST method identical
+import ccxt.pro as ccxt
 import os
 from typing import Dict, List, Literal, Optional
 from dotenv import load_dotenv
 from ..core.logging import logger
+from ._ttlcache import TTLCache, MARKETS_TTL, TICKER_TTL
 
 load_dotenv()
 
@@ -29,6 +33,9 @@ class OKXExchange:
             }
         })
 
+        # Cache for markets metadata and per-symbol tickers
+        self._cache = TTLCache()
+
         # Set demo header if needed
         if network == "demo":
             self.exchange.headers = {'x-simulated-trading': '1'}
@@ -38,18 +45,26 @@ class OKXExchange:
             logger.info("OKX initialized in LIVE mode")
 
     async def load_markets(self) -> Dict:
-        """Load market information."""
+        """Load market information (cached; metadata changes ~daily)."""
+        return await self._cache.get("markets", MARKETS_TTL, self._load_markets)
+
+    async def _load_markets(self) -> Dict:
         try:
-            markets = self.exchange.load_markets()
+            markets = await self.exchange.load_markets()
             return markets
         except Exception as e:
             logger.error(f"Failed to load markets: {e}")
             raise
 
     async def fetch_ticker(self, symbol: str) -> Dict:
-        """Fetch current ticker data for a symbol."""
+        """Fetch current ticker data for a symbol (short TTL cache)."""
+        return await self._cache.get(
+            f"ticker:{symbol}", TICKER_TTL, lambda: self._fetch_ticker(symbol)
+        )
+
+    async def _fetch_ticker(self, symbol: str) -> Dict:
         try:
-            ticker = self.exchange.fetch_ticker(symbol)
+            ticker = await self.exchange.fetch_ticker(symbol)
             return {
                 'symbol': symbol,
                 'bid': ticker['bid'],
@@ -65,7 +80,7 @@ class OKXExchange:
     async def place_limit_order(self, symbol: str, side: Literal["buy", "sell"], price: float, amount: float) -> Dict:
         """Place a limit order."""
         try:
-            order = self.exchange.create_limit_order(symbol, side, amount, price)
+            order = await self.exchange.create_limit_order(symbol, side, amount, price)
             logger.info(f"Placed {side} order: {amount} @ {price} for {symbol}")
             return {
                 'id': order['id'],
@@ -83,7 +98,7 @@ class OKXExchange:
     async def cancel_order(self, order_id: str, symbol: str) -> Dict:
         """Cancel an order."""
         try:
-            result = self.exchange.cancel_order(order_id, symbol)
+            result = await self.exchange.cancel_order(order_id, symbol)
             logger.info(f"Cancelled order {order_id}")
             return {'id': order_id, 'status': 'cancelled'}
         except Exception as e:
@@ -93,7 +108,7 @@ class OKXExchange:
     async def fetch_open_orders(self, symbol: str) -> List[Dict]:
         """Fetch all open orders for a symbol."""
         try:
-            orders = self.exchange.fetch_open_orders(symbol)
+            orders = await self.exchange.fetch_open_orders(symbol)
             return [{
                 'id': o['id'],
                 'symbol': o['symbol'],
@@ -111,7 +126,7 @@ class OKXExchange:
     async def fetch_balance(self) -> Dict:
         """Fetch account balance."""
         try:
-            balance = self.exchange.fetch_balance()
+            balance = await self.exchange.fetch_balance()
             return {
                 'free': balance['free'],
                 'used': balance['used'],
@@ -124,7 +139,7 @@ class OKXExchange:
     async def fetch_order(self, order_id: str, symbol: str) -> Dict:
         """Fetch a specific order by ID."""
         try:
-            order = self.exchange.fetch_order(order_id, symbol)
+            order = await self.exchange.fetch_order(order_id, symbol)
             return {
                 'id': order['id'],
                 'symbol': order['symbol'],
@@ -140,8 +155,40 @@ class OKXExchange:
             logger.error(f"Failed to fetch order {order_id}: {e}")
             raise
 
+    async def watch_orders(self, symbol: str):
+        """Stream order updates over websocket as an async iterator.
+
+        Push-based alternative to polling fetch_open_orders: fills arrive
+        in sub-second instead of on the next poll tick.
+        """
+        while True:
+            orders = await self.exchange.watch_orders(symbol)
+            for o in orders:
+                yield {
+                    'id': o['id'],
+                    'symbol': o['symbol'],
+                    'side': o['side'],
+                    'price': o['price'],
+                    'amount': o['amount'],
+                    'remaining': o['remaining'],
+                    'status': o['status'],
+                    'timestamp': o['timestamp']
+                }
+
+    async def snapshot(self, symbol: str) -> Dict:
+        """Fetch balance, ticker and open orders for a symbol in parallel.
+
+        The three requests are independent, so issuing them together costs
+        roughly the slowest one instead of their sum.
+        """
+        balance, ticker, open_orders = await asyncio.gather(
+            self.fetch_balance(),
+            self.fetch_ticker(symbol),
+            self.fetch_open_orders(symbol),
+        )
+        return {'balance': balance, 'ticker': ticker, 'open_orders': open_orders}
+
     async def close(self):
         """Close exchange connection."""
-        if hasattr(self.exchange, 'close'):
-            self.exchange.close()
+        await self.exchange.close()
         logger.info("OKX exchange connection closed")
\ No newline at end of file
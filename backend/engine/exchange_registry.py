@@ -0,0 +1,41 @@
+"""Shared exchange client registry.
+
+Creating an exchange client per request pays a fresh TCP connect and TLS
+handshake that is immediately thrown away. Clients here are built lazily,
+reused across handlers so ccxt/httpx keep-alive pools stay warm, and closed
+once on application shutdown or after credentials change.
+"""
+import os
+from .exchange_okx_ccxt import OKXExchange
+from .exchange_bitkub import BitkubExchange
+from ..core.logging import logger
+
+_clients: dict = {}
+
+
+def get_exchange_client(exchange: str = None):
+    """Return the shared client for an exchange, creating it on first use.
+
+    Defaults to the EXCHANGE environment setting when no name is given.
+    """
+    name = (exchange or os.getenv("EXCHANGE", "okx")).lower()
+    client = _clients.get(name)
+    if client is None:
+        if name == "okx":
+            client = OKXExchange()
+        elif name == "bitkub":
+            client = BitkubExchange()
+        else:
+            raise ValueError(f"Unknown exchange: {name}")
+        _clients[name] = client
+    return client
+
+
+async def close_all_clients():
+    """Close and forget every cached client (shutdown or credential change)."""
+    while _clients:
+        _, client = _clients.popitem()
+        try:
+            await client.close()
+        except Exception as e:
+            logger.warning(f"Failed to close cached exchange client: {e}")
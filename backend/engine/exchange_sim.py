@@ -1,100 +1,198 @@
 import asyncio
+import heapq
 import random
 import time
+import numpy as np
+from dataclasses import dataclass, asdict
 from typing import Dict, List, Literal, Optional
-from collections import defaultdict
+from collections import defaultdict, deque
 from ..core.logging import logger
 
 
+@dataclass(slots=True)
+class Order:
+    """Resting order record; slots keep per-order memory flat and make
+    the hot status/price reads in matching plain attribute loads."""
+    id: str
+    symbol: str
+    side: str
+    price: float
+    amount: float
+    filled: float
+    remaining: float
+    status: str
+    timestamp: int
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class Trade:
+    """Executed fill record."""
+    id: str
+    order_id: str
+    symbol: str
+    side: str
+    price: float
+    amount: float
+    timestamp: int
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
 class SimulatedExchange:
     """Simulated exchange for testing strategies."""
 
+    # Cap on retained price samples and trades
+    HISTORY_MAXLEN = 100_000
+
+    # Identical tick served from cache within this window
+    TICKER_CACHE_TTL = 0.05
+
+    # Standard-normal samples drawn per RNG refill
+    NOISE_BATCH = 10_000
+
+    # Copying a presized template beats building the literal each refresh
+    _TICKER_TEMPLATE = {
+        'symbol': None, 'bid': 0.0, 'ask': 0.0,
+        'last': 0.0, 'volume': 0.0, 'timestamp': 0
+    }
+
     def __init__(self, initial_price: float = 62000.0, volatility: float = 0.001, seed: int = None):
         self.current_price = initial_price
         self.volatility = volatility
         self.orders = {}
         self.order_counter = 1000
+        # Price-sorted books: max-heap for buys (negated price), min-heap
+        # for sells. Matching only inspects the marketable tops instead of
+        # scanning every resting order each tick. Cancelled entries stay
+        # in the heap as tombstones and are skipped lazily on pop.
+        self._buys: List[tuple] = []
+        self._sells: List[tuple] = []
+        self._order_seq = 0
+        # symbol -> ordered set (dict) of open order ids: fetch_open_orders
+        # walks only the live subset instead of every order ever placed
+        self._open_ids: Dict[str, Dict[str, None]] = defaultdict(dict)
+        # Memoized symbol -> (base, quote): no split() churn per fill
+        self._symbol_parts: Dict[str, tuple] = {}
+        # symbol -> (built_at, ticker): coalesces rapid concurrent polls
+        self._ticker_cache: Dict[str, tuple] = {}
         self.balances = defaultdict(float)
         self.balances['USDT'] = 10000.0
         self.balances['BTC'] = 0.1
-        self.trades = []
-        self.price_history = [initial_price]
-        self.last_update = time.time()
+        # Ring buffers: O(1) appends with bounded memory on long sims
+        self.trades = deque(maxlen=self.HISTORY_MAXLEN)
+        self.price_history = deque([initial_price], maxlen=self.HISTORY_MAXLEN)
+        self._trade_counter = 0
+        self.last_update = time.monotonic()
 
         if seed is not None:
             random.seed(seed)
 
-        # Start price update task
-        self._running = True
-        asyncio.create_task(self._price_updater())
+        # Batch-sampled PCG64 normals served from a ring: refilling 10k at
+        # a time amortizes RNG cost versus per-tick random.gauss
+        self._rng = np.random.default_rng(seed)
+        self._noise = self._rng.standard_normal(self.NOISE_BATCH)
+        self._noise_i = 0
+
         logger.info(f"Simulated exchange initialized with price {initial_price}")
 
-    async def _price_updater(self):
-        """Update price with random walk."""
-        while self._running:
-            await asyncio.sleep(1)
-            change = random.gauss(0, self.volatility)
-            self.current_price *= (1 + change)
-            self.current_price = max(1, self.current_price)
-            self.price_history.append(self.current_price)
+    def _advance_price_to_now(self):
+        """Advance the random walk lazily to the current time.
 
-            # Check for order matches
-            await self._match_orders()
+        Event-driven replacement for the old 1s polling task: price moves
+        only when someone looks at it (ticker reads, order placement),
+        with the step variance scaled by the elapsed wall time.
+        """
+        now = time.monotonic()
+        dt = now - self.last_update
+        if dt < 1.0:
+            return
+        if self._noise_i >= self.NOISE_BATCH:
+            self._noise = self._rng.standard_normal(self.NOISE_BATCH)
+            self._noise_i = 0
+        z = self._noise[self._noise_i]
+        self._noise_i += 1
+        change = z * self.volatility * dt ** 0.5
+        self.current_price = max(1, self.current_price * (1 + change))
+        self.price_history.append(self.current_price)
+        self.last_update = now
+        # Cached tickers describe the old price
+        self._ticker_cache.clear()
 
     async def _match_orders(self):
-        """Match orders against current price."""
-        for order_id, order in list(self.orders.items()):
-            if order['status'] != 'open':
+        """Match resting orders against the current price.
+
+        Pops from the book tops while they are marketable: O(k log N) in
+        fills instead of O(N) in open orders per tick. Matching is pure
+        CPU, so the loop yields to the event loop every 128 candidates to
+        avoid starving other coroutines on large sweeps.
+        """
+        price = self.current_price
+        processed = 0
+        while self._buys and -self._buys[0][0] >= price:
+            entry = heapq.heappop(self._buys)
+            processed += 1
+            if processed & 127 == 0:
+                await asyncio.sleep(0)
+            order = self.orders.get(entry[2])
+            if order is None or order.status != 'open':
+                continue
+            if not self._execute_fill(order):
+                # Unaffordable at current balance; leave it resting
+                heapq.heappush(self._buys, entry)
+                break
+        while self._sells and self._sells[0][0] <= price:
+            entry = heapq.heappop(self._sells)
+            processed += 1
+            if processed & 127 == 0:
+                await asyncio.sleep(0)
+            order = self.orders.get(entry[2])
+            if order is None or order.status != 'open':
                 continue
+            if not self._execute_fill(order):
+                heapq.heappush(self._sells, entry)
+                break
+
+    def _execute_fill(self, order: Order) -> bool:
+        """Settle one marketable order; False when balance is short."""
+        parts = self._symbol_parts.get(order.symbol)
+        if parts is None:
+            parts = self._symbol_parts[order.symbol] = tuple(order.symbol.split('/'))
+        base_currency, quote_currency = parts
 
-            matched = False
-            if order['side'] == 'buy' and self.current_price <= order['price']:
-                matched = True
-            elif order['side'] == 'sell' and self.current_price >= order['price']:
-                matched = True
-
-            if matched:
-                # Execute trade
-                base_currency = order['symbol'].split('/')[0]
-                quote_currency = order['symbol'].split('/')[1]
-
-                if order['side'] == 'buy':
-                    cost = order['amount'] * order['price']
-                    if self.balances[quote_currency] >= cost:
-                        self.balances[quote_currency] -= cost
-                        self.balances[base_currency] += order['amount']
-                        order['status'] = 'filled'
-                        order['filled'] = order['amount']
-                        order['remaining'] = 0
-
-                        self.trades.append({
-                            'id': f"trade_{len(self.trades) + 1}",
-                            'order_id': order_id,
-                            'symbol': order['symbol'],
-                            'side': order['side'],
-                            'price': order['price'],
-                            'amount': order['amount'],
-                            'timestamp': int(time.time() * 1000)
-                        })
-                        logger.info(f"Simulated fill: {order['side']} {order['amount']} @ {order['price']}")
-                else:  # sell
-                    if self.balances[base_currency] >= order['amount']:
-                        self.balances[base_currency] -= order['amount']
-                        self.balances[quote_currency] += order['amount'] * order['price']
-                        order['status'] = 'filled'
-                        order['filled'] = order['amount']
-                        order['remaining'] = 0
-
-                        self.trades.append({
-                            'id': f"trade_{len(self.trades) + 1}",
-                            'order_id': order_id,
-                            'symbol': order['symbol'],
-                            'side': order['side'],
-                            'price': order['price'],
-                            'amount': order['amount'],
-                            'timestamp': int(time.time() * 1000)
-                        })
-                        logger.info(f"Simulated fill: {order['side']} {order['amount']} @ {order['price']}")
+        if order.side == 'buy':
+            cost = order.amount * order.price
+            if self.balances[quote_currency] < cost:
+                return False
+            self.balances[quote_currency] -= cost
+            self.balances[base_currency] += order.amount
+        else:  # sell
+            if self.balances[base_currency] < order.amount:
+                return False
+            self.balances[base_currency] -= order.amount
+            self.balances[quote_currency] += order.amount * order.price
+
+        order.status = 'filled'
+        order.filled = order.amount
+        order.remaining = 0
+        self._open_ids[order.symbol].pop(order.id, None)
+
+        # Monotonic counter: stable IDs even after ring-buffer eviction
+        self._trade_counter += 1
+        self.trades.append(Trade(
+            id=f"trade_{self._trade_counter}",
+            order_id=order.id,
+            symbol=order.symbol,
+            side=order.side,
+            price=order.price,
+            amount=order.amount,
+            timestamp=time.time_ns() // 1_000_000
+        ))
+        logger.info(f"Simulated fill: {order.side} {order.amount} @ {order.price}")
+        return True
 
     async def load_markets(self) -> Dict:
         """Load market information."""
@@ -111,52 +209,70 @@ class SimulatedExchange:
         }
 
     async def fetch_ticker(self, symbol: str) -> Dict:
-        """Fetch current ticker data for a symbol."""
+        """Fetch current ticker data for a symbol (50ms cache)."""
+        self._advance_price_to_now()
+        await self._match_orders()
+
+        cached = self._ticker_cache.get(symbol)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self.TICKER_CACHE_TTL:
+            return cached[1]
+
         spread = self.current_price * 0.001
-        return {
-            'symbol': symbol,
-            'bid': self.current_price - spread,
-            'ask': self.current_price + spread,
-            'last': self.current_price,
-            'volume': random.uniform(100, 1000),
-            'timestamp': int(time.time() * 1000)
-        }
+        ticker = self._TICKER_TEMPLATE.copy()
+        ticker['symbol'] = symbol
+        ticker['bid'] = self.current_price - spread
+        ticker['ask'] = self.current_price + spread
+        ticker['last'] = self.current_price
+        ticker['volume'] = random.uniform(100, 1000)
+        ticker['timestamp'] = time.time_ns() // 1_000_000
+        self._ticker_cache[symbol] = (now, ticker)
+        return ticker
 
     async def place_limit_order(self, symbol: str, side: Literal["buy", "sell"], price: float, amount: float) -> Dict:
         """Place a limit order."""
         order_id = f"sim_{self.order_counter}"
         self.order_counter += 1
 
-        order = {
-            'id': order_id,
-            'symbol': symbol,
-            'side': side,
-            'price': price,
-            'amount': amount,
-            'filled': 0,
-            'remaining': amount,
-            'status': 'open',
-            'timestamp': int(time.time() * 1000)
-        }
+        order = Order(
+            id=order_id,
+            symbol=symbol,
+            side=side,
+            price=price,
+            amount=amount,
+            filled=0,
+            remaining=amount,
+            status='open',
+            timestamp=time.time_ns() // 1_000_000
+        )
 
         self.orders[order_id] = order
+        self._open_ids[symbol][order_id] = None
+        self._order_seq += 1
+        if side == 'buy':
+            heapq.heappush(self._buys, (-price, self._order_seq, order_id))
+        else:
+            heapq.heappush(self._sells, (price, self._order_seq, order_id))
         logger.info(f"Simulated order placed: {side} {amount} @ {price}")
-        return order
+
+        # Fill immediately marketable orders without waiting for a ticker read
+        self._advance_price_to_now()
+        await self._match_orders()
+        return order.to_dict()
 
     async def cancel_order(self, order_id: str, symbol: str) -> Dict:
         """Cancel an order."""
         if order_id in self.orders:
-            self.orders[order_id]['status'] = 'cancelled'
+            order = self.orders[order_id]
+            order.status = 'cancelled'
+            self._open_ids[order.symbol].pop(order_id, None)
             logger.info(f"Simulated order cancelled: {order_id}")
             return {'id': order_id, 'status': 'cancelled'}
         raise Exception(f"Order {order_id} not found")
 
     async def fetch_open_orders(self, symbol: str) -> List[Dict]:
         """Fetch all open orders for a symbol."""
-        return [
-            order for order in self.orders.values()
-            if order['symbol'] == symbol and order['status'] == 'open'
-        ]
+        return [self.orders[oid].to_dict() for oid in self._open_ids[symbol]]
 
     async def fetch_balance(self) -> Dict:
         """Fetch account balance."""
@@ -169,10 +285,9 @@ class SimulatedExchange:
     async def fetch_order(self, order_id: str, symbol: str) -> Dict:
         """Fetch a specific order by ID."""
         if order_id in self.orders:
-            return self.orders[order_id]
+            return self.orders[order_id].to_dict()
         raise Exception(f"Order {order_id} not found")
 
     async def close(self):
         """Close exchange connection."""
-        self._running = False
         logger.info("Simulated exchange closed")
\ No newline at end of file
@@ -1,132 +1,197 @@
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Tuple
+import numpy as np
 from ..core.logging import logger
 
 
-class ExchangeValidator:
-    """Validate orders against exchange requirements."""
-
-    # Minimum requirements per exchange
-    REQUIREMENTS = {
-        "okx": {
-            "BTC/USDT": {
-                "min_size": 0.00001,
-                "min_value": 5.0,
-                "size_step": 0.00000001,  # Allow smaller steps for testing
-                "price_tick": 0.1
-            },
-            "ETH/USDT": {
-                "min_size": 0.001,
-                "min_value": 5.0,
-                "size_step": 0.0001,
-                "price_tick": 0.01
-            },
-            "SOL/USDT": {
-                "min_size": 0.01,
-                "min_value": 5.0,
-                "size_step": 0.01,
-                "price_tick": 0.001
-            }
+@dataclass(slots=True, frozen=True)
+class Spec:
+    """Flattened order requirements for one (exchange, symbol) pair.
+
+    Reciprocals are precomputed so quantization multiplies instead of
+    divides in the per-order hot path.
+    """
+    min_size: float
+    min_value: float
+    size_step: float
+    price_tick: float
+    inv_size_step: float = 0.0
+    inv_price_tick: float = 0.0
+
+    def __post_init__(self):
+        if self.size_step > 0:
+            object.__setattr__(self, 'inv_size_step', 1.0 / self.size_step)
+        if self.price_tick > 0:
+            object.__setattr__(self, 'inv_price_tick', 1.0 / self.price_tick)
+
+
+# Minimum requirements per exchange
+REQUIREMENTS = {
+    "okx": {
+        "BTC/USDT": {
+            "min_size": 0.00001,
+            "min_value": 5.0,
+            "size_step": 0.00000001,  # Allow smaller steps for testing
+            "price_tick": 0.1
+        },
+        "ETH/USDT": {
+            "min_size": 0.001,
+            "min_value": 5.0,
+            "size_step": 0.0001,
+            "price_tick": 0.01
+        },
+        "SOL/USDT": {
+            "min_size": 0.01,
+            "min_value": 5.0,
+            "size_step": 0.01,
+            "price_tick": 0.001
+        }
+    },
+    "bitkub": {
+        "THB_BTC": {
+            "min_size": 0.000003,  # ~0.000003 BTC (10 THB) for Bitkub
+            "min_value": 10.0,
+            "size_step": 0.00000001,
+            "price_tick": 0.01
         },
-        "bitkub": {
-            "THB_BTC": {
-                "min_size": 0.000003,  # ~0.000003 BTC (10 THB) for Bitkub
-                "min_value": 10.0,
-                "size_step": 0.00000001,
-                "price_tick": 0.01
-            },
-            "THB_ETH": {
-                "min_size": 0.005,
-                "min_value": 10.0,
-                "size_step": 0.00000001,
-                "price_tick": 0.01
-            }
+        "THB_ETH": {
+            "min_size": 0.005,
+            "min_value": 10.0,
+            "size_step": 0.00000001,
+            "price_tick": 0.01
         }
     }
-
-    @staticmethod
-    def validate_order(exchange: str, symbol: str, size: float, price: float) -> Tuple[bool, str]:
-        """
-        Validate if order meets exchange requirements.
-        Returns (is_valid, error_message).
-        """
-        # Get requirements
-        if exchange not in ExchangeValidator.REQUIREMENTS:
-            return True, ""  # Unknown exchange, skip validation
-
-        exchange_reqs = ExchangeValidator.REQUIREMENTS[exchange]
-        if symbol not in exchange_reqs:
+}
+
+# Flattened at import time: one tuple-key lookup plus slot reads per
+# order instead of nested dict probes
+_SPEC = {
+    (ex, sym): Spec(**reqs)
+    for ex, syms in REQUIREMENTS.items()
+    for sym, reqs in syms.items()
+}
+
+
+def validate_order(exchange: str, symbol: str, size: float, price: float) -> Tuple[bool, str]:
+    """
+    Validate if order meets exchange requirements.
+    Returns (is_valid, error_message).
+    """
+    spec = _SPEC.get((exchange, symbol))
+    if spec is None:
+        if exchange in REQUIREMENTS:
             logger.warning(f"No requirements found for {symbol} on {exchange}")
-            return True, ""  # Unknown symbol, skip validation
-
-        reqs = exchange_reqs[symbol]
-
-        # Check minimum size
-        if size < reqs["min_size"]:
-            return False, f"Order size {size} is below minimum {reqs['min_size']} for {symbol}"
-
-        # Check minimum value
-        order_value = size * price
-        if order_value < reqs["min_value"]:
-            return False, f"Order value {order_value:.2f} is below minimum {reqs['min_value']} for {symbol}"
-
-        # Check size step
-        if reqs["size_step"] > 0:
-            # Use proper floating point comparison
-            steps = round(size / reqs["size_step"])
-            expected_size = steps * reqs["size_step"]
-            tolerance = reqs["size_step"] * 0.001  # 0.1% tolerance
-            if abs(size - expected_size) > tolerance:
-                return False, f"Order size {size} doesn't match step size {reqs['size_step']} (expected: {expected_size})"
-
-        # Check price tick
-        if reqs["price_tick"] > 0:
-            # Use proper floating point comparison
-            ticks = round(price / reqs["price_tick"])
-            expected_price = ticks * reqs["price_tick"]
-            tolerance = reqs["price_tick"] * 0.001  # 0.1% tolerance
-            if abs(price - expected_price) > tolerance:
-                return False, f"Price {price} doesn't match tick size {reqs['price_tick']} (expected: {expected_price})"
-
-        return True, ""
-
-    @staticmethod
-    def round_size(exchange: str, symbol: str, size: float) -> float:
-        """Round size to match exchange requirements."""
-        if exchange not in ExchangeValidator.REQUIREMENTS:
-            return size
-
-        exchange_reqs = ExchangeValidator.REQUIREMENTS[exchange]
-        if symbol not in exchange_reqs:
-            return size
-
-        step = exchange_reqs[symbol]["size_step"]
-        if step > 0:
-            return round(size / step) * step
+        return True, ""  # Unknown exchange or symbol, skip validation
+
+    # Check minimum size
+    if size < spec.min_size:
+        return False, f"Order size {size} is below minimum {spec.min_size} for {symbol}"
+
+    # Check minimum value
+    order_value = size * price
+    if order_value < spec.min_value:
+        return False, f"Order value {order_value:.2f} is below minimum {spec.min_value} for {symbol}"
+
+    # Check size step: quantize to integer steps via the precomputed
+    # reciprocal (multiply beats divide) and compare the reconstruction
+    if spec.size_step > 0:
+        steps = round(size * spec.inv_size_step)
+        expected_size = steps * spec.size_step
+        if abs(size - expected_size) > spec.size_step * 0.001:  # 0.1% tolerance
+            return False, f"Order size {size} doesn't match step size {spec.size_step} (expected: {expected_size})"
+
+    # Check price tick, same integer-quantization form
+    if spec.price_tick > 0:
+        ticks = round(price * spec.inv_price_tick)
+        expected_price = ticks * spec.price_tick
+        if abs(price - expected_price) > spec.price_tick * 0.001:  # 0.1% tolerance
+            return False, f"Price {price} doesn't match tick size {spec.price_tick} (expected: {expected_price})"
+
+    return True, ""
+
+
+# validate_batch error codes, in check order
+BATCH_OK = 0
+BATCH_MIN_SIZE = 1
+BATCH_MIN_VALUE = 2
+BATCH_SIZE_STEP = 3
+BATCH_PRICE_TICK = 4
+
+
+def validate_batch(exchange: str, symbol: str, sizes, prices) -> Tuple[np.ndarray, np.ndarray]:
+    """Validate a whole grid of orders in one vectorized pass.
+
+    Returns (valid_mask, error_codes) aligned with the inputs; codes use
+    the BATCH_* constants with the same precedence as validate_order.
+    """
+    sizes = np.asarray(sizes, dtype=np.float64)
+    prices = np.asarray(prices, dtype=np.float64)
+    codes = np.zeros(sizes.shape[0], dtype=np.int8)
+
+    spec = _SPEC.get((exchange, symbol))
+    if spec is None:
+        return codes == BATCH_OK, codes
+
+    # Later assignments overwrite earlier ones, so apply checks in
+    # reverse precedence: the reported code matches the scalar path
+    if spec.price_tick > 0:
+        expected = np.round(prices * spec.inv_price_tick) * spec.price_tick
+        codes[np.abs(prices - expected) > spec.price_tick * 0.001] = BATCH_PRICE_TICK
+    if spec.size_step > 0:
+        expected = np.round(sizes * spec.inv_size_step) * spec.size_step
+        codes[np.abs(sizes - expected) > spec.size_step * 0.001] = BATCH_SIZE_STEP
+    codes[sizes * prices < spec.min_value] = BATCH_MIN_VALUE
+    codes[sizes < spec.min_size] = BATCH_MIN_SIZE
+
+    return codes == BATCH_OK, codes
+
+
+@lru_cache(maxsize=4096)
+def round_size(exchange: str, symbol: str, size: float) -> float:
+    """Round size to match exchange requirements.
+
+    Grid levels repeat the same arguments across rebalances, so results
+    are memoized; repeat calls cost one cache lookup.
+    """
+    spec = _SPEC.get((exchange, symbol))
+    if spec is None:
         return size
 
-    @staticmethod
-    def round_price(exchange: str, symbol: str, price: float) -> float:
-        """Round price to match exchange requirements."""
-        if exchange not in ExchangeValidator.REQUIREMENTS:
-            return price
+    if spec.size_step > 0:
+        return round(size * spec.inv_size_step) * spec.size_step
+    return size
 
-        exchange_reqs = ExchangeValidator.REQUIREMENTS[exchange]
-        if symbol not in exchange_reqs:
-            return price
 
-        tick = exchange_reqs[symbol]["price_tick"]
-        if tick > 0:
-            return round(price / tick) * tick
+@lru_cache(maxsize=4096)
+def round_price(exchange: str, symbol: str, price: float) -> float:
+    """Round price to match exchange requirements (memoized like round_size)."""
+    spec = _SPEC.get((exchange, symbol))
+    if spec is None:
         return price
 
-    @staticmethod
-    def get_minimum_order_info(exchange: str, symbol: str) -> Dict:
-        """Get minimum order requirements for display."""
-        if exchange not in ExchangeValidator.REQUIREMENTS:
-            return {}
+    if spec.price_tick > 0:
+        return round(price * spec.inv_price_tick) * spec.price_tick
+    return price
+
+
+def get_minimum_order_info(exchange: str, symbol: str) -> Dict:
+    """Get minimum order requirements for display."""
+    exchange_reqs = REQUIREMENTS.get(exchange)
+    if exchange_reqs is None or symbol not in exchange_reqs:
+        return {}
+
+    return exchange_reqs[symbol]
+
+
+class ExchangeValidator:
+    """Backward-compatible shim; hot callers can import the module-level
+    functions directly and skip the class-attribute dispatch."""
 
-        exchange_reqs = ExchangeValidator.REQUIREMENTS[exchange]
-        if symbol not in exchange_reqs:
-            return {}
+    REQUIREMENTS = REQUIREMENTS
+    _SPEC = _SPEC
 
-        return exchange_reqs[symbol]
\ No newline at end of file
+    validate_order = staticmethod(validate_order)
+    round_size = staticmethod(round_size)
+    round_price = staticmethod(round_price)
+    get_minimum_order_info = staticmethod(get_minimum_order_info)
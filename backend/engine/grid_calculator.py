@@ -1,5 +1,5 @@
 from typing import List, Tuple, Literal
-import math
+import numpy as np
 from ..core.logging import logger
 
 
@@ -14,12 +14,8 @@ class GridCalculator:
         if upper_bound <= lower_bound:
             raise ValueError("Upper bound must be greater than lower bound")
 
-        step = (upper_bound - lower_bound) / (total_levels - 1)
-        levels = []
-
-        for i in range(total_levels):
-            level = lower_bound + (i * step)
-            levels.append(round(level, 8))
+        # One vectorized call instead of a Python loop with per-level round()
+        levels = np.round(np.linspace(lower_bound, upper_bound, total_levels), 8).tolist()
 
         logger.info(f"Calculated {total_levels} fixed grid levels from {lower_bound} to {upper_bound}")
         return levels
@@ -32,13 +28,9 @@ class GridCalculator:
         if upper_bound <= lower_bound:
             raise ValueError("Upper bound must be greater than lower bound")
 
-        # Calculate percentage step: r = (upper/lower)^(1/(levels-1)) - 1
-        r = math.pow(upper_bound / lower_bound, 1 / (total_levels - 1)) - 1
-        levels = []
-
-        for i in range(total_levels):
-            level = lower_bound * math.pow(1 + r, i)
-            levels.append(round(level, 8))
+        # Geometric progression lower * r**i with r = (upper/lower)^(1/(n-1))
+        # is exactly np.geomspace, vectorized in one call
+        levels = np.round(np.geomspace(lower_bound, upper_bound, total_levels), 8).tolist()
 
         logger.info(f"Calculated {total_levels} percent grid levels from {lower_bound} to {upper_bound}")
         return levels
@@ -58,6 +50,42 @@ class GridCalculator:
         else:
             raise ValueError(f"Invalid spacing type: {spacing_type}")
 
+    @staticmethod
+    def build_grid(
+        lower_bound: float,
+        upper_bound: float,
+        total_levels: int,
+        spacing_type: Literal["fixed", "percent"] = "fixed",
+        mid_price: float = None,
+        position_size_per_level: float = None
+    ) -> dict:
+        """Build prices, sizes and sides for a whole grid in one pass.
+
+        Fused alternative to calling calculate_grid, calculate_position_sizes
+        and determine_side separately: returns a dict of parallel NumPy
+        arrays ('price', 'size', 'side') so consumers iterate one structure
+        instead of zipping three lists. Sizes/sides are omitted when their
+        inputs are not given.
+        """
+        if total_levels < 2:
+            raise ValueError("Total levels must be at least 2")
+        if upper_bound <= lower_bound:
+            raise ValueError("Upper bound must be greater than lower bound")
+
+        if spacing_type == "fixed":
+            prices = np.round(np.linspace(lower_bound, upper_bound, total_levels), 8)
+        elif spacing_type == "percent":
+            prices = np.round(np.geomspace(lower_bound, upper_bound, total_levels), 8)
+        else:
+            raise ValueError(f"Invalid spacing type: {spacing_type}")
+
+        grid = {'price': prices}
+        if position_size_per_level is not None:
+            grid['size'] = np.full(total_levels, position_size_per_level, dtype=np.float64)
+        if mid_price is not None:
+            grid['side'] = GridCalculator.determine_sides(prices, mid_price)
+        return grid
+
     @staticmethod
     def determine_side(price: float, mid_price: float) -> Literal["buy", "sell", "skip"]:
         """Determine order side based on price relative to mid price."""
@@ -70,6 +98,20 @@ class GridCalculator:
         else:
             return "skip"
 
+    @staticmethod
+    def determine_sides(prices, mid_price: float, tolerance: float = 0.00001):
+        """Classify a whole array of level prices in one vectorized pass.
+
+        Returns an ndarray of 'buy'/'sell'/'skip' matching determine_side
+        applied elementwise.
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        return np.select(
+            [prices < mid_price - tolerance, prices > mid_price + tolerance],
+            ['buy', 'sell'],
+            default='skip'
+        )
+
     @staticmethod
     def calculate_position_sizes(
         levels: List[float],
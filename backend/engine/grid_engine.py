@@ -1,4 +1,7 @@
 import asyncio
+import time
+import numpy as np
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Literal
 from datetime import datetime
 from ..core.config_models import GridConfig, RuntimeState
@@ -10,21 +13,128 @@ from .exchange_base import BaseExchange
 from .exchange_sim import SimulatedExchange
 from .exchange_okx_ccxt import OKXExchange
 from .exchange_bitkub import BitkubExchange
-from .exchange_validator import ExchangeValidator
+from .exchange_validator import validate_order, round_price, round_size
+
+
+@dataclass(slots=True)
+class OrderRecord:
+    """Per-order tracking record.
+
+    Slots cut per-order memory roughly in half versus a six-key dict and
+    make the hot status/level reads plain attribute loads.
+    """
+    level_index: int
+    zone_id: int
+    side: str
+    price: float
+    size: float
+    status: str = 'open'
 
 
 class GridEngine:
     """Main grid trading engine."""
 
+    # Caps on in-flight cancel/placement requests so bulk operations stay
+    # within exchange rate limits
+    MAX_CONCURRENT_CANCELS = 10
+    MAX_CONCURRENT_PLACEMENTS = 10
+
+    # Minimum seconds between PnL refreshes: bursts of fills share one
+    # balance+ticker round-trip instead of paying it per fill
+    PNL_UPDATE_INTERVAL = 60.0
+
+    # How long a fetched mid price stays fresh for side decisions: a burst
+    # of fills shares one ticker fetch instead of one per replacement
+    TICKER_TTL = 1.0
+
+    # Write-combining window for active-level publishes: rapid toggles
+    # collapse into one subscriber broadcast
+    ACTIVE_LEVELS_DEBOUNCE = 0.1
+
     def __init__(self):
         self.config: Optional[GridConfig] = None
         self.exchange: Optional[BaseExchange] = None
         self.levels: List[float] = []
-        self.active_orders: Dict[str, dict] = {}
+        self._levels_np: np.ndarray = np.empty(0, dtype=np.float64)
+        # Per-grid precomputed validator results (see initialize)
+        self._rounded_prices: List[float] = []
+        self._rounded_size: float = 0.0
+        self._level_valid: List[tuple] = []
+        self._price_to_level: Dict[float, int] = {}
+        self.active_orders: Dict[str, OrderRecord] = {}
+        # Reverse indexes: O(1) level->open-order and zone->levels lookups
+        # instead of scanning active_orders/zone_map per UI action
+        self.level_to_order_id: Dict[int, str] = {}
+        self.zone_to_levels: Dict[int, List[int]] = {}
+        # Levels whose zone is enabled, maintained incrementally so
+        # publishing active levels is O(changed) instead of an O(N) rescan
+        self._enabled_levels: set = set()
         self.zone_map: dict = {}
         self.running = False
         self.monitor_task = None
+        # Wakes the polling monitor early (e.g. on stop) instead of
+        # letting it sleep out the rest of its interval
+        self._wake = asyncio.Event()
         self.db = None
+        self._orders_snapshot: tuple = ()
+        self._orders_dirty = True
+        # Bumped whenever levels, zones or orders change; read endpoints
+        # key their caches (and HTTP ETags) on it
+        self.grid_version = 0
+        self._last_pnl_ts = 0.0
+        self._mid_price: float = 0.0
+        self._mid_price_ts = 0.0
+        self._base_ccy: str = ""
+        self._quote_ccy: str = ""
+        # Open-orders snapshot handed from start-up sync to the monitor's
+        # first poll so it can skip a duplicate fetch
+        self._pending_open_orders: Optional[List[dict]] = None
+        self._levels_publish_task: Optional[asyncio.Task] = None
+        # Levels with a replacement already in flight; duplicate fill
+        # notifications for the same level are dropped instead of racing
+        # a second ticker+placement
+        self._replacing: set = set()
+
+    def mark_orders_dirty(self):
+        """Flag the active-orders snapshot for rebuild after a mutation."""
+        self._orders_dirty = True
+        self.grid_version += 1
+
+    def remove_order(self, order_id: str):
+        """Drop an order from the books, keeping the level index in sync.
+
+        Callers outside the engine must use this instead of deleting from
+        active_orders directly, or level_to_order_id keeps a dangling id.
+        """
+        record = self.active_orders.pop(order_id, None)
+        if record is None:
+            return
+        if self.level_to_order_id.get(record.level_index) == order_id:
+            self.level_to_order_id.pop(record.level_index, None)
+        self.mark_orders_dirty()
+
+    @property
+    def orders_snapshot(self) -> tuple:
+        """Immutable point-in-time view of active orders for read endpoints.
+
+        Rebuilt copy-on-write when orders changed, so request handlers never
+        iterate the live dict while the engine task is mutating it.
+        """
+        if self._orders_dirty:
+            self._orders_snapshot = tuple(
+                {
+                    'id': order_id,
+                    'level_index': order_info.level_index,
+                    'price': order_info.price,
+                    'side': order_info.side,
+                    'amount': order_info.size,
+                    'zone_id': order_info.zone_id,
+                    'status': order_info.status
+                }
+                for order_id, order_info in self.active_orders.items()
+            )
+            self._orders_dirty = False
+        return self._orders_snapshot
 
     async def initialize(self, config: GridConfig):
         """Initialize the grid engine with configuration."""
@@ -38,6 +148,18 @@ class GridEngine:
             config.total_levels,
             config.spacing_type
         )
+        # Cached ndarray view for vectorized lookups (levels are ascending)
+        self._levels_np = np.asarray(self.levels, dtype=np.float64)
+
+        # Exchange, symbol, position size and level prices are fixed for
+        # the life of the grid: round and validate once here instead of
+        # per placement/replacement
+        self._rounded_prices = [round_price(config.exchange, config.symbol, p)
+                                for p in self.levels]
+        self._rounded_size = round_size(config.exchange, config.symbol, config.position_size)
+        self._level_valid = [validate_order(config.exchange, config.symbol,
+                                            config.position_size, p)
+                             for p in self.levels]
 
         # Map levels to zones
         if config.zones:
@@ -48,9 +170,27 @@ class GridEngine:
             self.zone_map = {i: {'zone_id': 0, 'enabled': True, 'price': self.levels[i]}
                             for i in range(len(self.levels))}
 
+        # Build the zone -> levels reverse index once per grid
+        self.zone_to_levels = {}
+        for level_index, zone_info in self.zone_map.items():
+            self.zone_to_levels.setdefault(zone_info['zone_id'], []).append(level_index)
+
+        self._enabled_levels = {i for i, z in self.zone_map.items() if z['enabled']}
+
+        # Symbol components are fixed per grid; split once instead of on
+        # every PnL refresh
+        self._base_ccy, _, self._quote_ccy = config.symbol.partition('/')
+
+        # Exact-price lookup for syncing our own orders back to levels;
+        # covers both raw and exchange-rounded level prices
+        self._price_to_level = {round(p, 8): i for i, p in enumerate(self.levels)}
+        for i, p in enumerate(self._rounded_prices):
+            self._price_to_level.setdefault(round(p, 8), i)
+
         # Initialize exchange
         await self._init_exchange()
 
+        self.grid_version += 1
         logger.info(f"Grid engine initialized with {len(self.levels)} levels")
 
     async def _init_exchange(self):
@@ -107,6 +247,7 @@ class GridEngine:
 
         await state_manager.set_state("STOPPING")
         self.running = False
+        self._wake.set()
 
         # Cancel monitoring task
         if self.monitor_task:
@@ -161,37 +302,50 @@ class GridEngine:
 
             # Clear local tracking only if we got real orders from exchange
             self.active_orders.clear()
+            self.level_to_order_id.clear()
+
+            # Our own orders sit at exact grid prices, so an O(1) dict
+            # lookup resolves the level for the common case; only orders
+            # at off-grid prices (manual ones) fall through to the
+            # vectorized closest-level search
+            closest_levels = [self._price_to_level.get(round(order['price'], 8))
+                              for order in open_orders]
+            misses = [pos for pos, lvl in enumerate(closest_levels) if lvl is None]
+            if misses:
+                prices = np.fromiter(
+                    (open_orders[pos]['price'] for pos in misses),
+                    dtype=np.float64, count=len(misses)
+                )
+                hi = np.clip(np.searchsorted(self._levels_np, prices), 0, len(self._levels_np) - 1)
+                lo = np.clip(hi - 1, 0, len(self._levels_np) - 1)
+                closest = np.where(
+                    np.abs(self._levels_np[hi] - prices) < np.abs(self._levels_np[lo] - prices),
+                    hi, lo
+                )
+                for pos, lvl in zip(misses, closest.tolist()):
+                    closest_levels[pos] = lvl
 
-            # Map exchange orders to grid levels
-            for order in open_orders:
+            for order, closest_level in zip(open_orders, closest_levels):
                 order_price = order['price']
+                self.active_orders[order['id']] = OrderRecord(
+                    level_index=closest_level,
+                    zone_id=self.zone_map.get(closest_level, {}).get('zone_id', 0),
+                    side=order['side'],
+                    price=order_price,
+                    size=order.get('amount', self.config.position_size)
+                )
+                self.level_to_order_id[closest_level] = order['id']
+                logger.info(f"Synced order {order['id']} at price {order_price} to level {closest_level}")
 
-                # Find closest grid level
-                closest_level = None
-                min_diff = float('inf')
-                for i, level_price in enumerate(self.levels):
-                    diff = abs(order_price - level_price)
-                    if diff < min_diff:
-                        min_diff = diff
-                        closest_level = i
-
-                # Add to active orders tracking
-                if closest_level is not None:
-                    self.active_orders[order['id']] = {
-                        'level_index': closest_level,
-                        'zone_id': self.zone_map.get(closest_level, {}).get('zone_id', 0),
-                        'side': order['side'],
-                        'price': order_price,
-                        'size': order.get('amount', self.config.position_size),
-                        'status': 'open'
-                    }
-                    logger.info(f"Synced order {order['id']} at price {order_price} to level {closest_level}")
-
-            # Update active levels based on synced orders
-            active_levels = list(set(order_info['level_index'] for order_info in self.active_orders.values()))
-            await state_manager.set_active_levels(active_levels)
+            self.mark_orders_dirty()
+
+            # level_to_order_id keys are exactly the occupied levels; no
+            # need to rebuild a set from active_orders
+            await state_manager.set_active_levels(list(self.level_to_order_id))
 
             logger.info(f"Synced {len(self.active_orders)} orders with grid engine")
+            # Let the monitor's first poll reuse this snapshot
+            self._pending_open_orders = open_orders
             return True
         except Exception as e:
             logger.warning(f"Could not sync with exchange orders: {e}")
@@ -213,124 +367,203 @@ class GridEngine:
         # Check for existing orders at each level to prevent duplicates
         existing_levels = set()
         for order_info in self.active_orders.values():
-            if order_info['status'] == 'open':
-                existing_levels.add(order_info['level_index'])
+            if order_info.status == 'open':
+                existing_levels.add(order_info.level_index)
 
         # Get current market price
-        ticker = await self.exchange.fetch_ticker(self.config.symbol)
-        mid_price = ticker['last']
+        mid_price = await self._get_mid_price()
 
-        placed_count = 0
-        for i, level_price in enumerate(self.levels):
-            # Skip if order already exists at this level
-            if i in existing_levels:
-                logger.info(f"Order already exists at level {i}, skipping")
-                continue
+        # Filter levels with vectorized masks instead of a Python loop of
+        # determine_side/zone/validity checks per level, then place the
+        # survivors concurrently: placements are independent HTTP calls,
+        # so wall time is one round-trip plus semaphore pacing
+        n = len(self.levels)
+        sides = GridCalculator.determine_sides(self._levels_np, mid_price)
 
-            # Check if zone is enabled
-            if i in self.zone_map and not self.zone_map[i]['enabled']:
-                continue
+        enabled_mask = np.ones(n, dtype=bool)
+        disabled = [i for i, z in self.zone_map.items() if not z['enabled']]
+        if disabled:
+            enabled_mask[disabled] = False
 
-            # Determine order side
-            side = GridCalculator.determine_side(level_price, mid_price)
-            if side == "skip":
-                continue
+        valid_mask = np.fromiter((v[0] for v in self._level_valid), dtype=bool, count=n)
 
-            try:
-                # Validate order before placing
-                is_valid, error_msg = ExchangeValidator.validate_order(
-                    self.config.exchange,
-                    self.config.symbol,
-                    self.config.position_size,
-                    level_price
-                )
+        existing_mask = np.zeros(n, dtype=bool)
+        for i in existing_levels:
+            logger.info(f"Order already exists at level {i}, skipping")
+            existing_mask[i] = True
 
-                if not is_valid:
-                    logger.warning(f"Order validation failed at level {i}: {error_msg}")
-                    continue
+        candidate = enabled_mask & (sides != 'skip') & ~existing_mask
+        for i in np.where(candidate & ~valid_mask)[0].tolist():
+            logger.warning(f"Order validation failed at level {i}: {self._level_valid[i][1]}")
 
-                # Round values to match exchange requirements
-                rounded_price = ExchangeValidator.round_price(
-                    self.config.exchange,
-                    self.config.symbol,
-                    level_price
-                )
-                rounded_size = ExchangeValidator.round_size(
-                    self.config.exchange,
-                    self.config.symbol,
-                    self.config.position_size
-                )
+        to_place = [(i, self.levels[i], str(sides[i]))
+                    for i in np.where(candidate & valid_mask)[0].tolist()]
 
-                # Place order
+        sem = asyncio.Semaphore(self.MAX_CONCURRENT_PLACEMENTS)
+
+        async def _place_one(i, level_price, side):
+            async with sem:
+                # Precomputed exchange-compliant rounding
                 order = await self.exchange.place_limit_order(
                     self.config.symbol,
                     side,
-                    rounded_price,
-                    rounded_size
+                    self._rounded_prices[i],
+                    self._rounded_size
                 )
 
-                self.active_orders[order['id']] = {
-                    'level_index': i,
-                    'zone_id': self.zone_map.get(i, {}).get('zone_id', 0),
-                    'side': side,
-                    'price': level_price,
-                    'size': self.config.position_size,
-                    'status': 'open'
-                }
+            self.active_orders[order['id']] = OrderRecord(
+                level_index=i,
+                zone_id=self.zone_map.get(i, {}).get('zone_id', 0),
+                side=side,
+                price=level_price,
+                size=self.config.position_size
+            )
+            self.level_to_order_id[i] = order['id']
 
+        # return_exceptions keeps partial progress when single levels fail
+        results = await asyncio.gather(
+            *[_place_one(i, level_price, side) for i, level_price, side in to_place],
+            return_exceptions=True
+        )
+        placed_count = 0
+        for (i, _, _), result in zip(to_place, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to place order at level {i}: {result}")
+            else:
                 placed_count += 1
 
-            except Exception as e:
-                logger.error(f"Failed to place order at level {i}: {e}")
-
+        self.mark_orders_dirty()
+        # Fresh placements make the sync snapshot stale; force a real fetch
+        self._pending_open_orders = None
         logger.info(f"Placed {placed_count} initial grid orders")
-        await state_manager.set_active_levels([i for i in range(len(self.levels))
-                                               if i in self.zone_map and self.zone_map[i]['enabled']])
+        self._schedule_active_levels_publish()
 
     async def _monitor_orders(self):
-        """Monitor orders for fills and replace as needed."""
-        last_valid_order_count = 0
+        """Monitor orders for fills and replace as needed.
+
+        Prefers the exchange's websocket order stream (watch_orders) so
+        fills are handled on arrival; falls back to REST polling at
+        config.poll_interval for connectors without a stream.
+        """
+        if hasattr(self.exchange, 'watch_orders'):
+            try:
+                await self._watch_orders_loop()
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Order stream unavailable, falling back to polling: {e}")
+
+        await self._poll_orders_loop()
+
+    async def _handle_fill(self, order_id: str, level_index: int):
+        """Mark a filled order and replace it at the same grid level."""
+        logger.info(f"Order {order_id} filled at level {level_index}")
+
+        self.active_orders[order_id].status = 'filled'
+        self.level_to_order_id.pop(level_index, None)
+        self.mark_orders_dirty()
+
+        # Replace order at same level (static grid)
+        await self._replace_order(level_index)
+
+        # Update PnL, throttled so fill bursts don't serialize round-trips
+        now = time.monotonic()
+        if now - self._last_pnl_ts >= self.PNL_UPDATE_INTERVAL:
+            self._last_pnl_ts = now
+            await self._update_pnl()
+
+    async def _watch_orders_loop(self):
+        """Event-driven monitoring over the exchange order stream."""
+        async for update in self.exchange.watch_orders(self.config.symbol):
+            if not self.running:
+                break
+            order_info = self.active_orders.get(update['id'])
+            if order_info is None or order_info.status != 'open':
+                continue
+            if update['status'] in ('closed', 'filled'):
+                await self._handle_fill(update['id'], order_info.level_index)
 
+    async def _sleep_until_wake(self, timeout: float):
+        """Sleep up to timeout seconds, returning early if _wake is set."""
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wake.clear()
+
+    async def _poll_orders_loop(self):
+        """REST polling fallback: diff open orders every poll_interval."""
+        self._wake.clear()
         while self.running:
             try:
-                # Fetch open orders
-                open_orders = await self.exchange.fetch_open_orders(self.config.symbol)
+                # Reuse the start-up sync snapshot on the first iteration
+                # instead of refetching what sync just fetched
+                if self._pending_open_orders is not None:
+                    open_orders = self._pending_open_orders
+                    self._pending_open_orders = None
+                else:
+                    open_orders = await self.exchange.fetch_open_orders(self.config.symbol)
 
                 # If API returns empty but we have orders, likely API issue - skip this cycle
                 if len(open_orders) == 0 and len(self.active_orders) > 0:
                     logger.warning(f"API returned 0 orders but we track {len(self.active_orders)} orders - likely API issue, skipping")
-                    await asyncio.sleep(5)
+                    await self._sleep_until_wake(self.config.poll_interval)
                     continue
 
                 open_order_ids = {o['id'] for o in open_orders}
 
                 # Only process if we got valid data from API
                 if len(open_orders) > 0:
-                    last_valid_order_count = len(open_orders)
+                    # Collect fills first, then mutate: avoids copying the
+                    # whole dict (list(...)) on every tick just to guard
+                    # against mutation during iteration
+                    filled = [(order_id, order_info.level_index)
+                              for order_id, order_info in self.active_orders.items()
+                              if order_id not in open_order_ids and order_info.status == 'open']
+                    for order_id, level_index in filled:
+                        await self._handle_fill(order_id, level_index)
 
-                    # Check for filled orders
-                    for order_id, order_info in list(self.active_orders.items()):
-                        if order_id not in open_order_ids and order_info['status'] == 'open':
-                            # Order was filled
-                            logger.info(f"Order {order_id} filled at level {order_info['level_index']}")
+                await self._sleep_until_wake(self.config.poll_interval)
 
-                            # Update order status
-                            self.active_orders[order_id]['status'] = 'filled'
+            except Exception as e:
+                logger.error(f"Error in order monitoring: {e}")
+                await self._sleep_until_wake(self.config.poll_interval * 2)
 
-                            # Replace order at same level (static grid)
-                            await self._replace_order(order_info['level_index'])
+    def _schedule_active_levels_publish(self):
+        """Publish enabled levels after a short debounce window.
 
-                            # Update PnL
-                            await self._update_pnl()
+        Back-to-back toggles within ACTIVE_LEVELS_DEBOUNCE share one
+        state_manager broadcast; the flush reads _enabled_levels at fire
+        time, so it always publishes the latest state.
+        """
+        if self._levels_publish_task is None or self._levels_publish_task.done():
+            self._levels_publish_task = asyncio.create_task(self._flush_active_levels())
 
-                await asyncio.sleep(5)  # Check every 5 seconds
+    async def _flush_active_levels(self):
+        await asyncio.sleep(self.ACTIVE_LEVELS_DEBOUNCE)
+        await state_manager.set_active_levels(sorted(self._enabled_levels))
 
-            except Exception as e:
-                logger.error(f"Error in order monitoring: {e}")
-                await asyncio.sleep(10)
+    async def _get_mid_price(self) -> float:
+        """Return the last traded price, cached for TICKER_TTL seconds.
+
+        Side decisions only need an approximate mid, so replacements and
+        manual placements within a burst reuse one ticker fetch.
+        """
+        now = time.monotonic()
+        if now - self._mid_price_ts >= self.TICKER_TTL:
+            ticker = await self.exchange.fetch_ticker(self.config.symbol)
+            self._mid_price = ticker['last']
+            self._mid_price_ts = time.monotonic()
+        return self._mid_price
 
     async def _replace_order(self, level_index: int):
-        """Replace a filled order at the same grid level."""
+        """Replace a filled order at the same grid level.
+
+        At most one replacement per level is in flight: resync races can
+        report the same fill twice, and a second concurrent placement
+        would double up the level.
+        """
         if not self.running:
             return
 
@@ -338,81 +571,104 @@ class GridEngine:
         if level_index in self.zone_map and not self.zone_map[level_index]['enabled']:
             return
 
+        if level_index in self._replacing:
+            return
+        self._replacing.add(level_index)
         try:
-            # Get current market price to determine side
-            ticker = await self.exchange.fetch_ticker(self.config.symbol)
-            mid_price = ticker['last']
+            # Get current market price to determine side (TTL-cached)
+            mid_price = await self._get_mid_price()
             level_price = self.levels[level_index]
 
             side = GridCalculator.determine_side(level_price, mid_price)
             if side == "skip":
                 return
 
-            # Place new order at same level
+            # Place new order at same level (precomputed rounding)
             order = await self.exchange.place_limit_order(
                 self.config.symbol,
                 side,
-                level_price,
-                self.config.position_size
+                self._rounded_prices[level_index],
+                self._rounded_size
             )
 
-            self.active_orders[order['id']] = {
-                'level_index': level_index,
-                'zone_id': self.zone_map.get(level_index, {}).get('zone_id', 0),
-                'side': side,
-                'price': level_price,
-                'size': self.config.position_size,
-                'status': 'open'
-            }
+            self.active_orders[order['id']] = OrderRecord(
+                level_index=level_index,
+                zone_id=self.zone_map.get(level_index, {}).get('zone_id', 0),
+                side=side,
+                price=level_price,
+                size=self.config.position_size
+            )
+            self.level_to_order_id[level_index] = order['id']
 
+            self.mark_orders_dirty()
             logger.info(f"Replaced order at level {level_index}: {side} @ {level_price}")
 
         except Exception as e:
             logger.error(f"Failed to replace order at level {level_index}: {e}")
+        finally:
+            self._replacing.discard(level_index)
 
     async def _cancel_all_orders(self):
         """Cancel all open orders."""
         cancelled_count = 0
         open_orders = []
 
+        # Each cancel is an independent HTTP call: dispatch them
+        # concurrently instead of paying one round-trip per order, bounded
+        # by a semaphore to respect exchange rate limits
+        sem = asyncio.Semaphore(self.MAX_CONCURRENT_CANCELS)
+
+        async def _cancel(order_id):
+            async with sem:
+                try:
+                    await self.exchange.cancel_order(order_id, self.config.symbol)
+                    return order_id, None
+                except Exception as e:
+                    return order_id, e
+
         # First, fetch all open orders from the exchange
         try:
             open_orders = await self.exchange.fetch_open_orders(self.config.symbol)
             logger.info(f"Found {len(open_orders)} open orders on exchange")
 
-            # Cancel each order from the exchange
-            for order in open_orders:
-                try:
-                    await self.exchange.cancel_order(order['id'], self.config.symbol)
-                    cancelled_count += 1
-                    logger.info(f"Cancelled order {order['id']}")
+            results = await asyncio.gather(*[_cancel(o['id']) for o in open_orders])
+            for order_id, error in results:
+                if error is not None:
+                    logger.error(f"Failed to cancel order {order_id}: {error}")
+                    continue
+                cancelled_count += 1
+                logger.info(f"Cancelled order {order_id}")
 
-                    # Update local tracking if exists
-                    if order['id'] in self.active_orders:
-                        self.active_orders[order['id']]['status'] = 'cancelled'
-                except Exception as e:
-                    logger.error(f"Failed to cancel order {order['id']}: {e}")
+                # Update local tracking if exists
+                if order_id in self.active_orders:
+                    self.active_orders[order_id].status = 'cancelled'
         except Exception as e:
             logger.error(f"Failed to fetch open orders: {e}")
 
         # Also cancel any locally tracked orders that might not be on exchange
-        open_order_ids = [o['id'] for o in open_orders]
-        for order_id in list(self.active_orders.keys()):
-            if self.active_orders[order_id]['status'] == 'open':
-                if order_id not in open_order_ids:
-                    try:
-                        await self.exchange.cancel_order(order_id, self.config.symbol)
-                        self.active_orders[order_id]['status'] = 'cancelled'
-                        cancelled_count += 1
-                    except Exception as e:
-                        # Order might already be cancelled or filled
-                        self.active_orders[order_id]['status'] = 'unknown'
-                        logger.debug(f"Could not cancel order {order_id}: {e}")
+        open_order_ids = {o['id'] for o in open_orders}
+        leftovers = [order_id for order_id, order_info in self.active_orders.items()
+                     if order_info.status == 'open' and order_id not in open_order_ids]
+        results = await asyncio.gather(*[_cancel(order_id) for order_id in leftovers])
+        for order_id, error in results:
+            if error is None:
+                self.active_orders[order_id].status = 'cancelled'
+                cancelled_count += 1
+            else:
+                # Order might already be cancelled or filled
+                self.active_orders[order_id].status = 'unknown'
+                logger.debug(f"Could not cancel order {order_id}: {error}")
 
         # Clear all active orders tracking
         self.active_orders.clear()
-
-        # Update state to reflect no active levels
+        self.level_to_order_id.clear()
+        self.mark_orders_dirty()
+
+        # Drop any debounced publish so it can't land after the clear,
+        # then reflect no active levels immediately
+        if self._levels_publish_task is not None:
+            self._levels_publish_task.cancel()
+            self._levels_publish_task = None
         await state_manager.set_active_levels([])
 
         logger.info(f"Cancelled {cancelled_count} orders, cleared all order tracking")
@@ -429,16 +685,16 @@ class GridEngine:
     async def _update_pnl(self):
         """Update PnL calculations."""
         try:
-            # Simple PnL calculation (can be enhanced)
-            balance = await self.exchange.fetch_balance()
-            ticker = await self.exchange.fetch_ticker(self.config.symbol)
+            # Simple PnL calculation (can be enhanced); the two fetches are
+            # independent REST calls, so issue them concurrently
+            balance, ticker = await asyncio.gather(
+                self.exchange.fetch_balance(),
+                self.exchange.fetch_ticker(self.config.symbol)
+            )
 
             # Calculate unrealized PnL based on current positions
-            base_currency = self.config.symbol.split('/')[0]
-            quote_currency = self.config.symbol.split('/')[1]
-
-            base_value = balance['total'].get(base_currency, 0) * ticker['last']
-            quote_value = balance['total'].get(quote_currency, 0)
+            base_value = balance['total'].get(self._base_ccy, 0) * ticker['last']
+            quote_value = balance['total'].get(self._quote_ccy, 0)
             total_value = base_value + quote_value
 
             # Update state
@@ -451,43 +707,66 @@ class GridEngine:
     async def toggle_zone(self, zone_id: int, enabled: bool):
         """Enable or disable a zone."""
         zones_updated = 0
-        for level_index, zone_info in self.zone_map.items():
-            if zone_info['zone_id'] == zone_id:
-                self.zone_map[level_index]['enabled'] = enabled
-                zones_updated += 1
-
-                # Cancel orders in disabled zone
-                if not enabled:
-                    for order_id, order_info in list(self.active_orders.items()):
-                        if order_info['level_index'] == level_index and order_info['status'] == 'open':
-                            try:
-                                await self.exchange.cancel_order(order_id, self.config.symbol)
-                                self.active_orders[order_id]['status'] = 'cancelled'
-                            except Exception as e:
-                                logger.error(f"Failed to cancel order {order_id}: {e}")
+        to_cancel = []
+        for level_index in self.zone_to_levels.get(zone_id, ()):
+            self.zone_map[level_index]['enabled'] = enabled
+            if enabled:
+                self._enabled_levels.add(level_index)
+            else:
+                self._enabled_levels.discard(level_index)
+            zones_updated += 1
+
+            # Collect orders resting in the disabled zone
+            if not enabled:
+                order_id = self.level_to_order_id.get(level_index)
+                record = self.active_orders.get(order_id) if order_id is not None else None
+                if record is not None and record.status == 'open':
+                    to_cancel.append((level_index, order_id))
+
+        # Cancel the zone's orders concurrently: disabling a wide zone
+        # costs ~one round-trip instead of one per level
+        if to_cancel:
+            sem = asyncio.Semaphore(self.MAX_CONCURRENT_CANCELS)
+
+            async def _cancel(level_index, order_id):
+                async with sem:
+                    try:
+                        await self.exchange.cancel_order(order_id, self.config.symbol)
+                        rec = self.active_orders.get(order_id)
+                        if rec is not None:
+                            rec.status = 'cancelled'
+                        self.level_to_order_id.pop(level_index, None)
+                    except Exception as e:
+                        logger.error(f"Failed to cancel order {order_id}: {e}")
+
+            await asyncio.gather(*[_cancel(level_index, order_id)
+                                   for level_index, order_id in to_cancel])
 
+        self.mark_orders_dirty()
         logger.info(f"Zone {zone_id} {'enabled' if enabled else 'disabled'}, {zones_updated} levels affected")
 
-        # Update active levels
-        await state_manager.set_active_levels([i for i in range(len(self.levels))
-                                               if i in self.zone_map and self.zone_map[i]['enabled']])
+        # Update active levels (debounced)
+        self._schedule_active_levels_publish()
 
     async def cancel_order_at_level(self, level_index: int):
         """Cancel order at specific grid level."""
         if level_index < 0 or level_index >= len(self.levels):
             raise ValueError(f"Invalid level index: {level_index}")
 
-        # Find and cancel order at this level
-        for order_id, order_info in list(self.active_orders.items()):
-            if order_info['level_index'] == level_index and order_info['status'] == 'open':
-                try:
-                    await self.exchange.cancel_order(order_id, self.config.symbol)
-                    self.active_orders[order_id]['status'] = 'cancelled'
-                    logger.info(f"Cancelled order at level {level_index}")
-                    return True
-                except Exception as e:
-                    logger.error(f"Failed to cancel order {order_id}: {e}")
-                    raise
+        # Direct reverse-index lookup instead of scanning active_orders
+        order_id = self.level_to_order_id.get(level_index)
+        record = self.active_orders.get(order_id) if order_id is not None else None
+        if record is not None and record.status == 'open':
+            try:
+                await self.exchange.cancel_order(order_id, self.config.symbol)
+                record.status = 'cancelled'
+                self.level_to_order_id.pop(level_index, None)
+                self.mark_orders_dirty()
+                logger.info(f"Cancelled order at level {level_index}")
+                return True
+            except Exception as e:
+                logger.error(f"Failed to cancel order {order_id}: {e}")
+                raise
 
         logger.warning(f"No active order found at level {level_index}")
         return False
@@ -502,38 +781,39 @@ class GridEngine:
             raise ValueError(f"Zone for level {level_index} is disabled")
 
         # Check if order already exists at this level
-        for order_id, order_info in self.active_orders.items():
-            if order_info['level_index'] == level_index and order_info['status'] == 'open':
-                logger.warning(f"Order already exists at level {level_index}")
-                return False
+        existing_id = self.level_to_order_id.get(level_index)
+        existing = self.active_orders.get(existing_id) if existing_id is not None else None
+        if existing is not None and existing.status == 'open':
+            logger.warning(f"Order already exists at level {level_index}")
+            return False
 
         try:
-            # Get current market price to determine side
-            ticker = await self.exchange.fetch_ticker(self.config.symbol)
-            mid_price = ticker['last']
+            # Get current market price to determine side (TTL-cached)
+            mid_price = await self._get_mid_price()
             level_price = self.levels[level_index]
 
             side = GridCalculator.determine_side(level_price, mid_price)
             if side == "skip":
                 raise ValueError(f"Cannot place order at mid price level {level_index}")
 
-            # Place new order at level
+            # Place new order at level (precomputed rounding)
             order = await self.exchange.place_limit_order(
                 self.config.symbol,
                 side,
-                level_price,
-                self.config.position_size
+                self._rounded_prices[level_index],
+                self._rounded_size
             )
 
-            self.active_orders[order['id']] = {
-                'level_index': level_index,
-                'zone_id': self.zone_map.get(level_index, {}).get('zone_id', 0),
-                'side': side,
-                'price': level_price,
-                'size': self.config.position_size,
-                'status': 'open'
-            }
+            self.active_orders[order['id']] = OrderRecord(
+                level_index=level_index,
+                zone_id=self.zone_map.get(level_index, {}).get('zone_id', 0),
+                side=side,
+                price=level_price,
+                size=self.config.position_size
+            )
+            self.level_to_order_id[level_index] = order['id']
 
+            self.mark_orders_dirty()
             logger.info(f"Placed order at level {level_index}: {side} @ {level_price}")
             return True
 
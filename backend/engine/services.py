@@ -1,4 +1,7 @@
 import asyncio
+import time
+import orjson
+import numpy as np
 from typing import Optional, List, Dict
 from datetime import datetime
 from sqlalchemy.orm import Session
@@ -12,19 +15,95 @@ from .grid_engine import GridEngine
 class BotService:
     """High-level bot service orchestrating the grid engine."""
 
+    # Pending broadcast backlog; oldest events are dropped when clients
+    # fall this far behind
+    WS_QUEUE_MAXSIZE = 256
+
+    # Event types where only the newest queued value matters; older
+    # copies in the same burst are collapsed before sending
+    REPLACEABLE_EVENTS = frozenset({"pnl_update", "inventory_update", "levels_update"})
+
+    # A send slower than this counts as a stall; clients stalling this
+    # many times in a row are evicted
+    WS_SEND_TIMEOUT = 1.0
+    WS_MAX_SLOW_SENDS = 3
+
     def __init__(self):
         self.engine = GridEngine()
         self.config: Optional[GridConfig] = None
-        self.ws_clients: List = []
+        # Set: O(1) connect/disconnect even under reconnect storms
+        self.ws_clients: set = set()
+        # Status memoization: _status_rev bumps on every state/config
+        # change, so polled reads return the cached dict until then
+        self._status_rev = 0
+        self._status_cache: Optional[Dict] = None
+        self._status_cache_rev = -1
+        self._active_zone_ids: List[int] = []
+        # Grid-levels list memoized against the engine's grid_version,
+        # so steady-state polls reuse one list instead of rebuilding it
+        self._grid_levels_cache: Optional[List[Dict]] = None
+        self._grid_levels_version = -1
+        # Mid price only moves when the bounds do, so it's recomputed at
+        # config-change time rather than per level lookup
+        self._mid_price: float = 0.0
+        self._mid_tol: float = 1.0
+        # Broadcast timestamps are formatted once per second; only the
+        # millisecond suffix is rebuilt per event
+        self._last_ts_sec: int = -1
+        self._last_ts_str: str = ""
+        # Bounds concurrent log writes so a slow DB can't saturate the
+        # default thread pool
+        self._log_sem = asyncio.Semaphore(8)
+        # State events are queued here and fanned out by a dispatcher
+        # task, so the engine's notify path never waits on a socket
+        self._ws_queue: asyncio.Queue = asyncio.Queue(maxsize=self.WS_QUEUE_MAXSIZE)
+        self._ws_dispatcher: Optional[asyncio.Task] = None
+        # Consecutive slow-send count per client
+        self._ws_slow_sends: Dict = {}
+
+    def _log_action_sync(self, action: str, params: Dict, result: str = "success"):
+        """Open a session, write one action-log row, and close it."""
+        gen = get_db()
+        db = next(gen)
+        try:
+            save_action_log(
+                db,
+                action=action,
+                params=params,
+                result=result,
+                mode=self.config.mode if self.config else "",
+                exchange=self.config.exchange if self.config else ""
+            )
+        finally:
+            gen.close()
+
+    async def _log_action(self, action: str, params: Dict, result: str = "success"):
+        """Write an action log without blocking the event loop.
+
+        save_action_log is sync SQLAlchemy; a worker thread keeps its
+        commit latency out of the request path.
+        """
+        async with self._log_sem:
+            await asyncio.to_thread(self._log_action_sync, action, params, result)
+
+    def _invalidate_status(self):
+        """Mark the memoized status stale after a state or config change."""
+        self._status_rev += 1
 
     async def initialize(self, config: GridConfig):
         """Initialize the bot service."""
         self.config = config
+        self._active_zone_ids = self._get_active_zones()
+        self._mid_price = (config.upper_bound + config.lower_bound) / 2
+        self._invalidate_status()
         await self.engine.initialize(config)
 
         # Subscribe to state changes for WebSocket broadcast
         state_manager.subscribe(self.broadcast_state_update)
 
+        if self._ws_dispatcher is None or self._ws_dispatcher.done():
+            self._ws_dispatcher = asyncio.create_task(self._ws_dispatch_loop())
+
     async def start_bot(self, confirm: bool = False) -> Dict:
         """Start the trading bot."""
         if not confirm:
@@ -37,20 +116,13 @@ class BotService:
             # Enable the bot
             self.config.enabled = True
             state_manager.set_config(self.config)
+            self._invalidate_status()
 
         try:
             await self.engine.start()
 
             # Log action
-            db = next(get_db())
-            save_action_log(
-                db,
-                action="START",
-                params={"mode": self.config.mode, "exchange": self.config.exchange},
-                result="success",
-                mode=self.config.mode,
-                exchange=self.config.exchange
-            )
+            await self._log_action("START", {"mode": self.config.mode, "exchange": self.config.exchange})
 
             return {"success": True, "message": "Bot started successfully"}
 
@@ -70,17 +142,10 @@ class BotService:
             if self.config:
                 self.config.enabled = False
                 state_manager.set_config(self.config)
+                self._invalidate_status()
 
             # Log action
-            db = next(get_db())
-            save_action_log(
-                db,
-                action="STOP",
-                params={},
-                result="success",
-                mode=self.config.mode if self.config else "",
-                exchange=self.config.exchange if self.config else ""
-            )
+            await self._log_action("STOP", {})
 
             return {"success": True, "message": "Bot stopped successfully"}
 
@@ -97,15 +162,7 @@ class BotService:
             await self.engine.reset(clear_positions=clear_positions, cancel_only=cancel_only)
 
             # Log action
-            db = next(get_db())
-            save_action_log(
-                db,
-                action="RESET",
-                params={"clear_positions": clear_positions},
-                result="success",
-                mode=self.config.mode if self.config else "",
-                exchange=self.config.exchange if self.config else ""
-            )
+            await self._log_action("RESET", {"clear_positions": clear_positions})
 
             return {"success": True, "message": "Bot reset successfully"}
 
@@ -115,24 +172,27 @@ class BotService:
 
     async def update_config(self, new_config: GridConfig) -> Dict:
         """Update bot configuration."""
+        # UIs tend to PUT the whole form unchanged; a no-op update should
+        # not cost a config broadcast plus an action-log write
+        if self.config is not None and self.config == new_config:
+            return {"success": True, "message": "No changes"}
+
         old_config = self.config
         self.config = new_config
         state_manager.set_config(new_config)
+        self._active_zone_ids = self._get_active_zones()
+        self._mid_price = (new_config.upper_bound + new_config.lower_bound) / 2
+        # Fallback sides in the cached levels list depend on the mid price
+        self.engine.grid_version += 1
+        self._invalidate_status()
 
         # Log config change
-        db = next(get_db())
-        save_action_log(
-            db,
-            action="CONFIG_CHANGED",
-            params=new_config.model_dump(),
-            result="success",
-            mode=new_config.mode,
-            exchange=new_config.exchange
-        )
-
-        # If bot is running and critical params changed, require restart
-        state = await state_manager.get_state()
-        if state.state in ["RUNNING", "SIM_RUNNING"]:
+        await self._log_action("CONFIG_CHANGED", new_config.model_dump())
+
+        # If bot is running and critical params changed, require restart.
+        # The snapshot dict avoids a pydantic revalidation per call
+        state = state_manager.get_state_dict()
+        if state["state"] in ["RUNNING", "SIM_RUNNING"]:
             critical_changed = (
                 old_config.upper_bound != new_config.upper_bound or
                 old_config.lower_bound != new_config.lower_bound or
@@ -149,7 +209,7 @@ class BotService:
                 }
 
         # Reinitialize if not running
-        if state.state == "STOPPED":
+        if state["state"] == "STOPPED":
             await self.engine.initialize(new_config)
 
         return {"success": True, "message": "Configuration updated"}
@@ -160,15 +220,7 @@ class BotService:
             await self.engine.toggle_zone(zone_id, enabled)
 
             # Log action
-            db = next(get_db())
-            save_action_log(
-                db,
-                action="ZONE_TOGGLED",
-                params={"zone_id": zone_id, "enabled": enabled},
-                result="success",
-                mode=self.config.mode if self.config else "",
-                exchange=self.config.exchange if self.config else ""
-            )
+            await self._log_action("ZONE_TOGGLED", {"zone_id": zone_id, "enabled": enabled})
 
             return {"success": True, "message": f"Zone {zone_id} {'enabled' if enabled else 'disabled'}"}
 
@@ -177,53 +229,77 @@ class BotService:
             return {"success": False, "message": str(e)}
 
     async def get_status(self) -> Dict:
-        """Get current bot status."""
-        state = await state_manager.get_state()
+        """Get current bot status (memoized until the next state change)."""
+        if self._status_cache is not None and self._status_cache_rev == self._status_rev:
+            return self._status_cache
+
+        state = state_manager.get_state_dict()
         config = state_manager.get_config()
 
-        return {
-            "state": state.state,
+        status = {
+            "state": state["state"],
             "enabled": config.enabled if config else False,
             "mode": config.mode if config else "sim",
             "exchange": config.exchange if config else "okx",
             "network": config.network if config else "live",
             "symbol": config.symbol if config else "BTC/USDT",
-            "active_zones": self._get_active_zones(),
-            "active_levels": state.active_levels,
+            "active_zones": self._active_zone_ids,
+            "active_levels": state["active_levels"],
             "pnl": {
-                "realized": state.pnl_realized,
-                "unrealized": state.pnl_unrealized
+                "realized": state["pnl_realized"],
+                "unrealized": state["pnl_unrealized"]
             },
-            "inventory": state.inventory,
-            "last_error": state.last_error
+            "inventory": state["inventory"],
+            "last_error": state["last_error"]
         }
+        self._status_cache = status
+        self._status_cache_rev = self._status_rev
+        return status
 
     async def get_grid_levels(self) -> List[Dict]:
         """Get all grid levels with their status."""
-        if not self.engine.levels:
+        engine = self.engine
+        if not engine.levels:
             return []
 
-        # Check which levels have active orders
-        active_level_indices = set()
-        for order_info in self.engine.active_orders.values():
-            if order_info['status'] == 'open':
-                active_level_indices.add(order_info['level_index'])
+        if (self._grid_levels_cache is not None
+                and self._grid_levels_version == engine.grid_version):
+            return self._grid_levels_cache
+
+        # Open orders per level come straight from the engine's reverse
+        # index; no scan over active_orders
+        occupied = engine.level_to_order_id
+
+        # Classify fallback sides for order-less levels in one vectorized
+        # pass against the configured mid price
+        if self.config:
+            fallback_sides = np.select(
+                [engine._levels_np < self._mid_price - self._mid_tol,
+                 engine._levels_np > self._mid_price + self._mid_tol],
+                ['buy', 'sell'],
+                default='mid'
+            ).tolist()
+        else:
+            fallback_sides = ['unknown'] * len(engine.levels)
 
         levels = []
-        for i, price in enumerate(self.engine.levels):
-            zone_info = self.engine.zone_map.get(i, {})
+        for i, price in enumerate(engine.levels):
+            zone_info = engine.zone_map.get(i, {})
             # Level is active if there's an active order at this level
             # If no zones configured, consider all zones as enabled
             zone_enabled = zone_info.get('enabled', True) if zone_info else True
-            is_active = zone_enabled and i in active_level_indices
+            order_id = occupied.get(i)
+            record = engine.active_orders.get(order_id) if order_id is not None else None
             levels.append({
                 "index": i,
                 "price": price,
                 "zone_id": zone_info.get('zone_id', 0),
-                "active": is_active,
-                "side": self._determine_side_for_level(price)
+                "active": zone_enabled and record is not None,
+                "side": record.side if record is not None else fallback_sides[i]
             })
 
+        self._grid_levels_cache = levels
+        self._grid_levels_version = engine.grid_version
         return levels
 
     def _get_active_zones(self) -> List[int]:
@@ -232,50 +308,150 @@ class BotService:
             return []
         return [z.id for z in self.config.zones if z.enabled]
 
-    def _determine_side_for_level(self, price: float) -> str:
-        """Determine order side for a price level."""
+    def _determine_side_for_level(self, level_index: int, price: float) -> str:
+        """Determine order side for a grid level."""
         if not self.config:
             return "unknown"
 
-        # For grid bot, use actual level positions to determine side
-        # Check if there are active orders at this level
-        for order_info in self.engine.active_orders.values():
-            if abs(self.engine.levels[order_info['level_index']] - price) < 0.01:
-                return order_info['side']
-
-        # Fallback to mid-price calculation
-        mid_price = (self.config.upper_bound + self.config.lower_bound) / 2
-        tolerance = 1.0  # Small tolerance for mid price
+        # The open order at this level, if any, is authoritative; the
+        # reverse index replaces the old float-tolerance scan over
+        # active_orders
+        order_id = self.engine.level_to_order_id.get(level_index)
+        record = self.engine.active_orders.get(order_id) if order_id is not None else None
+        if record is not None:
+            return record.side
 
-        if price < mid_price - tolerance:
+        # Fallback to the cached mid price
+        if price < self._mid_price - self._mid_tol:
             return "buy"
-        elif price > mid_price + tolerance:
+        elif price > self._mid_price + self._mid_tol:
             return "sell"
         return "mid"
 
+    def _broadcast_timestamp(self) -> str:
+        """ISO timestamp for broadcasts, formatted once per second.
+
+        During event bursts only the millisecond suffix changes, so the
+        datetime/strftime work runs at most once a second.
+        """
+        now = time.time()
+        sec = int(now)
+        if sec != self._last_ts_sec:
+            self._last_ts_sec = sec
+            self._last_ts_str = datetime.utcfromtimestamp(sec).strftime("%Y-%m-%dT%H:%M:%S")
+        return f"{self._last_ts_str}.{int((now - sec) * 1000):03d}"
+
     def add_ws_client(self, client):
         """Add WebSocket client for broadcasting."""
-        self.ws_clients.append(client)
+        self.ws_clients.add(client)
 
     def remove_ws_client(self, client):
         """Remove WebSocket client."""
-        if client in self.ws_clients:
-            self.ws_clients.remove(client)
+        self.ws_clients.discard(client)
 
     async def broadcast_state_update(self, event: Dict):
-        """Broadcast state update to all WebSocket clients."""
-        message = {
+        """Queue a state event for WebSocket fan-out.
+
+        Runs inline on the state_manager notify path, so it only
+        invalidates the status cache and enqueues; the dispatcher task
+        pays the serialization and socket costs. When clients fall
+        behind, the oldest queued event is dropped to bound memory.
+        """
+        # Every state change flows through here via the state_manager
+        # subscription, so it doubles as the status-cache invalidation hook
+        self._invalidate_status()
+
+        if not self.ws_clients:
+            return
+
+        if self._ws_queue.full():
+            try:
+                self._ws_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        self._ws_queue.put_nowait(event)
+
+    async def _ws_dispatch_loop(self):
+        """Drain queued state events and broadcast them to clients.
+
+        A tick that fills many orders queues a burst of near-identical
+        events; the loop drains whatever has accumulated, keeps only the
+        newest event per replaceable type, and ships the rest in a single
+        envelope so a burst costs one encode and one send per client.
+        """
+        while True:
+            batch = [await self._ws_queue.get()]
+            while True:
+                try:
+                    batch.append(self._ws_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            if len(batch) > 1:
+                seen = set()
+                merged = []
+                for event in reversed(batch):
+                    etype = event.get("type")
+                    if etype in self.REPLACEABLE_EVENTS:
+                        if etype in seen:
+                            continue
+                        seen.add(etype)
+                    merged.append(event)
+                merged.reverse()
+                batch = merged
+
+            try:
+                await self._broadcast_now(batch[0] if len(batch) == 1 else batch)
+            except Exception as e:
+                logger.error(f"WS dispatch failed: {e}")
+
+    async def _broadcast_now(self, event):
+        """Serialize once and send to every client concurrently, so the
+        broadcast costs the slowest client rather than the sum.
+
+        A list becomes a batched envelope ("events"); a single dict keeps
+        the original per-event shape ("data").
+        """
+        if not self.ws_clients:
+            return
+
+        envelope = {
             "type": "state_update",
-            "timestamp": datetime.utcnow().isoformat(),
-            "data": event
+            "timestamp": self._broadcast_timestamp(),
         }
+        if isinstance(event, list):
+            envelope["events"] = event
+        else:
+            envelope["data"] = event
+        payload = orjson.dumps(envelope)
 
-        # Send to all connected clients
-        for client in self.ws_clients:
+        async def _safe_send(client):
             try:
-                await client.send_json(message)
+                await asyncio.wait_for(client.send_bytes(payload), timeout=self.WS_SEND_TIMEOUT)
+            except asyncio.TimeoutError:
+                slow = self._ws_slow_sends.get(client, 0) + 1
+                if slow >= self.WS_MAX_SLOW_SENDS:
+                    logger.warning("Evicting WebSocket client after repeated slow sends")
+                    await self._evict_ws_client(client)
+                else:
+                    self._ws_slow_sends[client] = slow
             except Exception as e:
                 logger.error(f"Failed to send WebSocket message: {e}")
+                await self._evict_ws_client(client)
+            else:
+                self._ws_slow_sends.pop(client, None)
+
+        await asyncio.gather(*(_safe_send(client) for client in list(self.ws_clients)),
+                             return_exceptions=True)
+
+    async def _evict_ws_client(self, client):
+        """Drop a dead or persistently stalled client and close its socket."""
+        self.remove_ws_client(client)
+        self._ws_slow_sends.pop(client, None)
+        try:
+            await client.close()
+        except Exception:
+            pass
 
     async def cancel_order_at_level(self, level_index: int) -> Dict:
         """Cancel order at specific grid level."""
@@ -283,15 +459,7 @@ class BotService:
             result = await self.engine.cancel_order_at_level(level_index)
 
             # Log action
-            db = next(get_db())
-            save_action_log(
-                db,
-                action="CANCEL_ORDER",
-                params={"level_index": level_index},
-                result="success",
-                mode=self.config.mode if self.config else "",
-                exchange=self.config.exchange if self.config else ""
-            )
+            await self._log_action("CANCEL_ORDER", {"level_index": level_index})
 
             return {"success": True, "message": f"Order at level {level_index} cancelled"}
         except Exception as e:
@@ -304,15 +472,7 @@ class BotService:
             result = await self.engine.enable_order_at_level(level_index)
 
             # Log action
-            db = next(get_db())
-            save_action_log(
-                db,
-                action="ENABLE_ORDER",
-                params={"level_index": level_index},
-                result="success",
-                mode=self.config.mode if self.config else "",
-                exchange=self.config.exchange if self.config else ""
-            )
+            await self._log_action("ENABLE_ORDER", {"level_index": level_index})
 
             return {"success": True, "message": f"Order at level {level_index} enabled"}
         except Exception as e:
@@ -321,6 +481,13 @@ class BotService:
 
     async def close(self):
         """Clean up resources."""
+        if self._ws_dispatcher is not None:
+            self._ws_dispatcher.cancel()
+            try:
+                await self._ws_dispatcher
+            except asyncio.CancelledError:
+                pass
+            self._ws_dispatcher = None
         await self.engine.close()
 
 
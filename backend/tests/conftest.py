@@ -0,0 +1,12 @@
+import pytest_asyncio
+
+from ..engine.exchange_bitkub import BitkubExchange
+
+
+@pytest_asyncio.fixture(scope="session")
+async def exchange():
+    """One BitkubExchange — one event loop and aiohttp pool — shared by
+    every integration module in the session."""
+    ex = BitkubExchange()
+    yield ex
+    await ex.close()
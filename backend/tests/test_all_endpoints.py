@@ -0,0 +1,35 @@
+"""Integration sweep over Bitkub private endpoints.
+
+Requires live API credentials; skipped when they are not configured.
+"""
+import os
+
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    not os.getenv("BITKUB_API_KEY"),
+    reason="Bitkub API credentials not configured"
+)
+
+# (endpoint, params) pairs exercising symbol formats and API versions
+ENDPOINTS = [
+    ("/api/v3/market/my-open-orders", {"sym": "BTC_THB"}),
+    ("/api/v3/market/my-open-orders", {"sym": "THB_BTC"}),
+    ("/api/v3/market/my-open-orders", {"sym": "BTC"}),
+    ("/api/v3/market/my-open-orders", {}),  # No symbol
+    ("/api/market/my-open-orders", {"sym": "BTC_THB"}),  # v1 endpoint
+    ("/api/v3/market/my-order-history", {"sym": "BTC_THB", "lmt": 10}),
+]
+
+
+@pytest.mark.parametrize("endpoint,params", ENDPOINTS)
+async def test_endpoint(exchange, endpoint, params):
+    """Each endpoint/params combination answers with a JSON object."""
+    response = await exchange._request("POST", endpoint, params, signed=True)
+    assert isinstance(response, dict)
+
+
+async def test_wallet(exchange):
+    """Balance fetch works against the same session."""
+    balance = await exchange.fetch_balance()
+    assert "total" in balance
@@ -0,0 +1,25 @@
+"""Integration checks for Bitkub open-order fetching.
+
+Requires live API credentials; skipped when they are not configured.
+"""
+import os
+
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    not os.getenv("BITKUB_API_KEY"),
+    reason="Bitkub API credentials not configured"
+)
+
+
+async def test_fetch_open_orders(exchange):
+    """fetch_open_orders normalizes the THB_BTC order list."""
+    orders = await exchange.fetch_open_orders("THB_BTC")
+    assert isinstance(orders, list)
+
+
+async def test_raw_open_orders(exchange):
+    """The raw v3 endpoint answers with a JSON object."""
+    response = await exchange._request("POST", "/api/v3/market/my-open-orders",
+                                       {"sym": "BTC_THB"}, signed=True)
+    assert isinstance(response, dict)
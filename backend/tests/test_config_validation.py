@@ -3,216 +3,92 @@ from pydantic import ValidationError
 from ..core.config_models import GridConfig, ZoneDef
 
 
+@pytest.fixture
+def base_config_kwargs() -> dict:
+    """Known-good GridConfig kwargs; tests override single fields."""
+    return {
+        "upper_bound": 65000,
+        "lower_bound": 60000,
+        "total_levels": 11,
+        "spacing_type": "fixed",
+        "spacing_value": 0,
+        "position_size": 0.001,
+        "max_exposure": 0.05,
+        "zones": [],
+        "enabled": False,
+        "mode": "sim",
+        "exchange": "okx",
+        "network": "live",
+        "symbol": "BTC/USDT",
+    }
+
+
 class TestConfigValidation:
     """Test suite for configuration validation."""
 
-    def test_valid_config(self):
+    def test_valid_config(self, base_config_kwargs):
         """Test valid configuration."""
-        config = GridConfig(
-            upper_bound=65000,
-            lower_bound=60000,
-            total_levels=11,
-            spacing_type="fixed",
-            spacing_value=0,
-            position_size=0.001,
-            max_exposure=0.05,
-            zones=[],
-            enabled=False,
-            mode="sim",
-            exchange="okx",
-            network="live",
-            symbol="BTC/USDT"
-        )
+        config = GridConfig(**base_config_kwargs)
         assert config.upper_bound == 65000
         assert config.lower_bound == 60000
         assert config.total_levels == 11
 
-    def test_bounds_validation(self):
+    def test_bounds_validation(self, base_config_kwargs):
         """Test upper/lower bounds validation."""
         # Invalid: upper <= lower
         with pytest.raises(ValidationError) as exc_info:
-            GridConfig(
-                upper_bound=60000,
-                lower_bound=60000,
-                total_levels=11,
-                spacing_type="fixed",
-                spacing_value=0,
-                position_size=0.001,
-                max_exposure=0.05,
-                zones=[],
-                enabled=False,
-                mode="sim",
-                exchange="okx",
-                symbol="BTC/USDT"
-            )
+            GridConfig(**{**base_config_kwargs, "upper_bound": 60000})
         assert "upper_bound must be > lower_bound" in str(exc_info.value)
 
         # Invalid: negative bounds
         with pytest.raises(ValidationError):
-            GridConfig(
-                upper_bound=-65000,
-                lower_bound=60000,
-                total_levels=11,
-                spacing_type="fixed",
-                spacing_value=0,
-                position_size=0.001,
-                max_exposure=0.05,
-                zones=[],
-                enabled=False,
-                mode="sim",
-                exchange="okx",
-                symbol="BTC/USDT"
-            )
+            GridConfig(**{**base_config_kwargs, "upper_bound": -65000})
 
-    def test_levels_validation(self):
+    def test_levels_validation(self, base_config_kwargs):
         """Test total levels validation."""
         # Invalid: levels < 2
         with pytest.raises(ValidationError):
-            GridConfig(
-                upper_bound=65000,
-                lower_bound=60000,
-                total_levels=1,
-                spacing_type="fixed",
-                spacing_value=0,
-                position_size=0.001,
-                max_exposure=0.05,
-                zones=[],
-                enabled=False,
-                mode="sim",
-                exchange="okx",
-                symbol="BTC/USDT"
-            )
+            GridConfig(**{**base_config_kwargs, "total_levels": 1})
 
-    def test_spacing_validation(self):
-        """Test spacing type and value validation."""
-        # Valid spacing types
-        for spacing_type in ["fixed", "percent"]:
-            config = GridConfig(
-                upper_bound=65000,
-                lower_bound=60000,
-                total_levels=11,
-                spacing_type=spacing_type,
-                spacing_value=0,
-                position_size=0.001,
-                max_exposure=0.05,
-                zones=[],
-                enabled=False,
-                mode="sim",
-                exchange="okx",
-                symbol="BTC/USDT"
-            )
-            assert config.spacing_type == spacing_type
+    @pytest.mark.parametrize("spacing_type", ["fixed", "percent"])
+    def test_valid_spacing_types(self, base_config_kwargs, spacing_type):
+        """Test that both spacing types are accepted."""
+        config = GridConfig(**{**base_config_kwargs, "spacing_type": spacing_type})
+        assert config.spacing_type == spacing_type
 
+    def test_spacing_validation(self, base_config_kwargs):
+        """Test spacing type and value validation."""
         # Invalid spacing type
         with pytest.raises(ValidationError):
-            GridConfig(
-                upper_bound=65000,
-                lower_bound=60000,
-                total_levels=11,
-                spacing_type="invalid",
-                spacing_value=0,
-                position_size=0.001,
-                max_exposure=0.05,
-                zones=[],
-                enabled=False,
-                mode="sim",
-                exchange="okx",
-                symbol="BTC/USDT"
-            )
+            GridConfig(**{**base_config_kwargs, "spacing_type": "invalid"})
 
         # Invalid: negative spacing value
         with pytest.raises(ValidationError):
-            GridConfig(
-                upper_bound=65000,
-                lower_bound=60000,
-                total_levels=11,
-                spacing_type="fixed",
-                spacing_value=-1,
-                position_size=0.001,
-                max_exposure=0.05,
-                zones=[],
-                enabled=False,
-                mode="sim",
-                exchange="okx",
-                symbol="BTC/USDT"
-            )
+            GridConfig(**{**base_config_kwargs, "spacing_value": -1})
 
-    def test_position_sizing_validation(self):
+    def test_position_sizing_validation(self, base_config_kwargs):
         """Test position size and max exposure validation."""
         # Invalid: negative position size
         with pytest.raises(ValidationError):
-            GridConfig(
-                upper_bound=65000,
-                lower_bound=60000,
-                total_levels=11,
-                spacing_type="fixed",
-                spacing_value=0,
-                position_size=-0.001,
-                max_exposure=0.05,
-                zones=[],
-                enabled=False,
-                mode="sim",
-                exchange="okx",
-                symbol="BTC/USDT"
-            )
+            GridConfig(**{**base_config_kwargs, "position_size": -0.001})
 
         # Invalid: negative max exposure
         with pytest.raises(ValidationError):
-            GridConfig(
-                upper_bound=65000,
-                lower_bound=60000,
-                total_levels=11,
-                spacing_type="fixed",
-                spacing_value=0,
-                position_size=0.001,
-                max_exposure=-0.05,
-                zones=[],
-                enabled=False,
-                mode="sim",
-                exchange="okx",
-                symbol="BTC/USDT"
-            )
+            GridConfig(**{**base_config_kwargs, "max_exposure": -0.05})
 
-    def test_exchange_network_validation(self):
+    def test_exchange_network_validation(self, base_config_kwargs):
         """Test exchange and network validation."""
         # Valid: OKX with demo network
-        config = GridConfig(
-            upper_bound=65000,
-            lower_bound=60000,
-            total_levels=11,
-            spacing_type="fixed",
-            spacing_value=0,
-            position_size=0.001,
-            max_exposure=0.05,
-            zones=[],
-            enabled=False,
-            mode="sim",
-            exchange="okx",
-            network="demo",
-            symbol="BTC/USDT"
-        )
+        config = GridConfig(**{**base_config_kwargs, "network": "demo"})
         assert config.network == "demo"
 
         # Invalid: Bitkub with demo network
         with pytest.raises(ValidationError) as exc_info:
-            GridConfig(
-                upper_bound=65000,
-                lower_bound=60000,
-                total_levels=11,
-                spacing_type="fixed",
-                spacing_value=0,
-                position_size=0.001,
-                max_exposure=0.05,
-                zones=[],
-                enabled=False,
-                mode="sim",
-                exchange="bitkub",
-                network="demo",
-                symbol="THB_BTC"
-            )
+            GridConfig(**{**base_config_kwargs, "exchange": "bitkub",
+                          "network": "demo", "symbol": "THB_BTC"})
         assert "Bitkub does not support demo network" in str(exc_info.value)
 
-    def test_zone_validation(self):
+    def test_zone_validation(self, base_config_kwargs):
         """Test zone configuration validation."""
         # Valid zones
         zones = [
@@ -220,62 +96,23 @@ class TestConfigValidation:
             ZoneDef(id=2, level_start=6, level_end=10, enabled=False)
         ]
 
-        config = GridConfig(
-            upper_bound=65000,
-            lower_bound=60000,
-            total_levels=11,
-            spacing_type="fixed",
-            spacing_value=0,
-            position_size=0.001,
-            max_exposure=0.05,
-            zones=zones,
-            enabled=False,
-            mode="sim",
-            exchange="okx",
-            symbol="BTC/USDT"
-        )
+        config = GridConfig(**{**base_config_kwargs, "zones": zones})
         assert len(config.zones) == 2
 
         # Invalid: level_end < level_start
         with pytest.raises(ValidationError):
             ZoneDef(id=1, level_start=5, level_end=2, enabled=True)
 
-    def test_symbol_patterns(self):
+    @pytest.mark.parametrize("exchange,symbol", [
+        ("okx", "BTC/USDT"),
+        ("okx", "ETH/USDT"),
+        ("okx", "SOL/USDT"),
+        ("bitkub", "THB_BTC"),
+        ("bitkub", "THB_ETH"),
+        ("bitkub", "THB_SOL"),
+    ])
+    def test_symbol_patterns(self, base_config_kwargs, exchange, symbol):
         """Test symbol validation for different exchanges."""
-        # OKX symbols
-        okx_symbols = ["BTC/USDT", "ETH/USDT", "SOL/USDT"]
-        for symbol in okx_symbols:
-            config = GridConfig(
-                upper_bound=65000,
-                lower_bound=60000,
-                total_levels=11,
-                spacing_type="fixed",
-                spacing_value=0,
-                position_size=0.001,
-                max_exposure=0.05,
-                zones=[],
-                enabled=False,
-                mode="sim",
-                exchange="okx",
-                symbol=symbol
-            )
-            assert config.symbol == symbol
-
-        # Bitkub symbols
-        bitkub_symbols = ["THB_BTC", "THB_ETH", "THB_SOL"]
-        for symbol in bitkub_symbols:
-            config = GridConfig(
-                upper_bound=65000,
-                lower_bound=60000,
-                total_levels=11,
-                spacing_type="fixed",
-                spacing_value=0,
-                position_size=0.001,
-                max_exposure=0.05,
-                zones=[],
-                enabled=False,
-                mode="sim",
-                exchange="bitkub",
-                symbol=symbol
-            )
-            assert config.symbol == symbol
\ No newline at end of file
+        config = GridConfig(**{**base_config_kwargs, "exchange": exchange,
+                               "symbol": symbol})
+        assert config.symbol == symbol
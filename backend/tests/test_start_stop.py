@@ -1,87 +1,111 @@
 import pytest
-import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+import pytest_asyncio
 from ..engine.services import BotService
-from ..core.config_models import GridConfig
+from ..core.config_models import GridConfig, ZoneDef
 from ..core.state import state_manager
 
+# Validated once at import; tests copy it instead of re-running the full
+# pydantic validation per fixture
+_BASE_CFG = GridConfig(
+    upper_bound=65000,
+    lower_bound=60000,
+    total_levels=11,
+    spacing_type="fixed",
+    spacing_value=0,
+    position_size=0.001,
+    max_exposure=0.05,
+    zones=[],
+    enabled=False,
+    mode="sim",
+    exchange="okx",
+    symbol="BTC/USDT"
+)
+
+
+def _boom(*args, **kwargs):
+    """Stand-in for GridEngine.start that always fails."""
+    raise RuntimeError("Test error")
+
+
+def _current_state() -> str:
+    """Bot state straight from the manager's snapshot — no await, no
+    RuntimeState revalidation per assertion."""
+    return state_manager.get_state_dict()["state"]
+
 
 class TestStartStop:
     """Test suite for bot start/stop flow."""
 
-    @pytest.fixture
+    # One event loop for the whole class: the shared service's engine owns
+    # loop-bound primitives (wake events, tasks) created at fixture time
+    pytestmark = pytest.mark.asyncio(loop_scope="class")
+
+    @pytest_asyncio.fixture(scope="class", loop_scope="class")
     async def bot_service(self):
-        """Create bot service instance."""
+        """One service instance shared by the class; initialize runs once."""
         service = BotService()
-        config = GridConfig(
-            upper_bound=65000,
-            lower_bound=60000,
-            total_levels=11,
-            spacing_type="fixed",
-            spacing_value=0,
-            position_size=0.001,
-            max_exposure=0.05,
-            zones=[],
-            enabled=False,
-            mode="sim",
-            exchange="okx",
-            symbol="BTC/USDT"
-        )
-        await service.initialize(config)
+        await service.initialize(_BASE_CFG.model_copy(deep=True))
         return service
 
-    @pytest.mark.asyncio
-    async def test_start_flow(self, bot_service):
-        """Test bot start flow."""
-        # Initial state should be STOPPED
-        state = await state_manager.get_state()
-        assert state.state == "STOPPED"
-
-        # Start without confirmation should fail
-        result = await bot_service.start_bot(confirm=False)
+    @pytest.fixture(autouse=True)
+    def log_calls(self, monkeypatch):
+        """Stub out DB access and record action-log kwargs in a plain list.
+
+        Cheaper than MagicMock call recording, and the kwargs are
+        inspected directly as dicts.
+        """
+        calls = []
+
+        def _fake_db():
+            yield None
+
+        monkeypatch.setattr('backend.engine.services.get_db', _fake_db)
+        monkeypatch.setattr('backend.engine.services.save_action_log',
+                            lambda db, **kw: calls.append(kw))
+        return calls
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def _reset_state(self, bot_service, log_calls):
+        """Restore STOPPED state and a disabled config between tests, so the
+        shared service starts each test from the same baseline."""
+        yield
+        await bot_service.stop_bot(confirm=True)
+        await state_manager.reset()
+
+    # One row per confirm-guarded action: method, extra kwargs, whether
+    # the bot must be running first, expected final states, and the
+    # expected config.enabled flag (None = not asserted)
+    FLOW_CASES = [
+        ("start_bot", {}, False, ["RUNNING", "SIM_RUNNING"], True),
+        ("stop_bot", {}, True, ["STOPPED"], False),
+        ("reset_bot", {"clear_positions": False}, True, None, None),
+        ("reset_bot", {"clear_positions": True}, True, None, None),
+    ]
+
+    @pytest.mark.parametrize("method,kwargs,start_first,final_states,expected_enabled",
+                             FLOW_CASES)
+    async def test_flow(self, bot_service, method, kwargs, start_first,
+                        final_states, expected_enabled):
+        """Each action refuses without confirmation and succeeds with it."""
+        if start_first:
+            await bot_service.start_bot(confirm=True)
+
+        call = getattr(bot_service, method)
+
+        # Without confirmation the action must refuse
+        result = await call(confirm=False, **kwargs)
         assert result["success"] is False
         assert "Confirmation required" in result["message"]
 
-        # Start with confirmation
-        with patch('backend.engine.services.get_db'):
-            with patch('backend.engine.services.save_action_log'):
-                result = await bot_service.start_bot(confirm=True)
-                assert result["success"] is True
-
-                # Check state changed to RUNNING or SIM_RUNNING
-                state = await state_manager.get_state()
-                assert state.state in ["RUNNING", "SIM_RUNNING"]
-
-                # Check enabled flag
-                config = state_manager.get_config()
-                assert config.enabled is True
-
-    @pytest.mark.asyncio
-    async def test_stop_flow(self, bot_service):
-        """Test bot stop flow."""
-        # Start the bot first
-        with patch('backend.engine.services.get_db'):
-            with patch('backend.engine.services.save_action_log'):
-                await bot_service.start_bot(confirm=True)
-
-                # Stop without confirmation should fail
-                result = await bot_service.stop_bot(confirm=False)
-                assert result["success"] is False
-                assert "Confirmation required" in result["message"]
-
-                # Stop with confirmation
-                result = await bot_service.stop_bot(confirm=True)
-                assert result["success"] is True
-
-                # Check state changed to STOPPED
-                state = await state_manager.get_state()
-                assert state.state == "STOPPED"
-
-                # Check enabled flag
-                config = state_manager.get_config()
-                assert config.enabled is False
-
-    @pytest.mark.asyncio
+        # With confirmation it succeeds
+        result = await call(confirm=True, **kwargs)
+        assert result["success"] is True
+
+        if final_states is not None:
+            assert _current_state() in final_states
+        if expected_enabled is not None:
+            assert state_manager.get_config().enabled is expected_enabled
+
     async def test_toggle_enabled(self, bot_service):
         """Test toggling enabled flag."""
         config = state_manager.get_config()
@@ -89,126 +113,72 @@ class TestStartStop:
 
         # Enable via config update
         config.enabled = True
-        with patch('backend.engine.services.get_db'):
-            with patch('backend.engine.services.save_action_log'):
-                result = await bot_service.update_config(config)
-                assert result["success"] is True
-
-                # Check enabled flag
-                updated_config = state_manager.get_config()
-                assert updated_config.enabled is True
-
-    @pytest.mark.asyncio
-    async def test_reset_flow(self, bot_service):
-        """Test bot reset flow."""
-        # Start the bot
-        with patch('backend.engine.services.get_db'):
-            with patch('backend.engine.services.save_action_log'):
-                await bot_service.start_bot(confirm=True)
-
-                # Reset without confirmation should fail
-                result = await bot_service.reset_bot(confirm=False)
-                assert result["success"] is False
-                assert "Confirmation required" in result["message"]
-
-                # Reset with confirmation (cancel only)
-                result = await bot_service.reset_bot(confirm=True, clear_positions=False)
-                assert result["success"] is True
-
-                # Reset with clear positions
-                result = await bot_service.reset_bot(confirm=True, clear_positions=True)
-                assert result["success"] is True
-
-    @pytest.mark.asyncio
+        result = await bot_service.update_config(config)
+        assert result["success"] is True
+
+        # Check enabled flag
+        updated_config = state_manager.get_config()
+        assert updated_config.enabled is True
+
     async def test_zone_toggle(self, bot_service):
         """Test zone enable/disable."""
-        # Create config with zones
-        config = GridConfig(
-            upper_bound=65000,
-            lower_bound=60000,
-            total_levels=11,
-            spacing_type="fixed",
-            spacing_value=0,
-            position_size=0.001,
-            max_exposure=0.05,
-            zones=[
-                {"id": 1, "level_start": 0, "level_end": 5, "enabled": True},
-                {"id": 2, "level_start": 6, "level_end": 10, "enabled": True}
-            ],
-            enabled=False,
-            mode="sim",
-            exchange="okx",
-            symbol="BTC/USDT"
-        )
-
-        with patch('backend.engine.services.get_db'):
-            with patch('backend.engine.services.save_action_log'):
-                await bot_service.update_config(config)
-                await bot_service.initialize(config)
-
-                # Disable zone 1
-                result = await bot_service.toggle_zone(1, enabled=False)
-                assert result["success"] is True
-                assert "disabled" in result["message"]
-
-                # Enable zone 1
-                result = await bot_service.toggle_zone(1, enabled=True)
-                assert result["success"] is True
-                assert "enabled" in result["message"]
-
-    @pytest.mark.asyncio
-    async def test_action_logging(self, bot_service):
+        # Base config plus two zones
+        config = _BASE_CFG.model_copy(deep=True, update={"zones": [
+            ZoneDef(id=1, level_start=0, level_end=5, enabled=True),
+            ZoneDef(id=2, level_start=6, level_end=10, enabled=True)
+        ]})
+
+        await bot_service.update_config(config)
+        await bot_service.initialize(config)
+
+        # Disable zone 1
+        result = await bot_service.toggle_zone(1, enabled=False)
+        assert result["success"] is True
+        assert "disabled" in result["message"]
+
+        # Enable zone 1
+        result = await bot_service.toggle_zone(1, enabled=True)
+        assert result["success"] is True
+        assert "enabled" in result["message"]
+
+    async def test_action_logging(self, bot_service, log_calls):
         """Test that actions are logged correctly."""
-        with patch('backend.engine.services.save_action_log') as mock_log:
-            with patch('backend.engine.services.get_db'):
-                # Start action
-                await bot_service.start_bot(confirm=True)
-                mock_log.assert_called()
-                call_args = mock_log.call_args[1]
-                assert call_args['action'] == 'START'
-
-                mock_log.reset_mock()
-
-                # Stop action
-                await bot_service.stop_bot(confirm=True)
-                mock_log.assert_called()
-                call_args = mock_log.call_args[1]
-                assert call_args['action'] == 'STOP'
-
-                mock_log.reset_mock()
-
-                # Reset action
-                await bot_service.reset_bot(confirm=True)
-                mock_log.assert_called()
-                call_args = mock_log.call_args[1]
-                assert call_args['action'] == 'RESET'
-
-    @pytest.mark.asyncio
+        # Start action
+        await bot_service.start_bot(confirm=True)
+        assert log_calls
+        assert log_calls[-1]['action'] == 'START'
+
+        log_calls.clear()
+
+        # Stop action
+        await bot_service.stop_bot(confirm=True)
+        assert log_calls
+        assert log_calls[-1]['action'] == 'STOP'
+
+        log_calls.clear()
+
+        # Reset action
+        await bot_service.reset_bot(confirm=True)
+        assert log_calls
+        assert log_calls[-1]['action'] == 'RESET'
+
     async def test_state_transitions(self, bot_service):
         """Test state machine transitions."""
         # STOPPED -> STARTING -> RUNNING
-        state = await state_manager.get_state()
-        assert state.state == "STOPPED"
-
-        with patch('backend.engine.services.get_db'):
-            with patch('backend.engine.services.save_action_log'):
-                # Start will transition through STARTING
-                await bot_service.start_bot(confirm=True)
-                state = await state_manager.get_state()
-                assert state.state in ["RUNNING", "SIM_RUNNING"]
-
-                # RUNNING -> STOPPING -> STOPPED
-                await bot_service.stop_bot(confirm=True)
-                state = await state_manager.get_state()
-                assert state.state == "STOPPED"
-
-    @pytest.mark.asyncio
-    async def test_error_handling(self, bot_service):
+        assert _current_state() == "STOPPED"
+
+        # Start will transition through STARTING
+        await bot_service.start_bot(confirm=True)
+        assert _current_state() in ["RUNNING", "SIM_RUNNING"]
+
+        # RUNNING -> STOPPING -> STOPPED
+        await bot_service.stop_bot(confirm=True)
+        assert _current_state() == "STOPPED"
+
+    async def test_error_handling(self, bot_service, monkeypatch):
         """Test error state handling."""
         # Simulate error during start
-        with patch('backend.engine.grid_engine.GridEngine.start', side_effect=Exception("Test error")):
-            with patch('backend.engine.services.get_db'):
-                with patch('backend.engine.services.save_action_log'):
-                    result = await bot_service.start_bot(confirm=True)
-                    assert result["success"] is False
-                    assert "Test error" in result["message"]
\ No newline at end of file
+        monkeypatch.setattr('backend.engine.grid_engine.GridEngine.start', _boom)
+        result = await bot_service.start_bot(confirm=True)
+        assert result["success"] is False
+        assert "Test error" in result["message"]
@@ -50,14 +50,18 @@ function initializeWebSocket() {
     const wsUrl = `${protocol}//${window.location.host}/api/ws`;
 
     ws = new WebSocket(wsUrl);
+    ws.binaryType = 'arraybuffer';
 
     ws.onopen = () => {
         console.log('WebSocket connected');
         document.getElementById('ws-status').className = 'ws-status connected';
     };
 
+    const utf8Decoder = new TextDecoder();
     ws.onmessage = (event) => {
-        const data = JSON.parse(event.data);
+        // Server broadcasts binary (orjson) frames; pings still arrive as text
+        const text = event.data instanceof ArrayBuffer ? utf8Decoder.decode(event.data) : event.data;
+        const data = JSON.parse(text);
         handleWebSocketMessage(data);
     };
 
@@ -87,7 +91,12 @@ function handleWebSocketMessage(data) {
             updateStatus(data.data);
             break;
         case 'state_update':
-            handleStateUpdate(data.data);
+            // Bursty updates arrive batched in "events"; single ones in "data"
+            if (data.events) {
+                data.events.forEach(handleStateUpdate);
+            } else {
+                handleStateUpdate(data.data);
+            }
             break;
         default:
             console.log('Unknown WebSocket message:', data);